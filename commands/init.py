@@ -1,14 +1,10 @@
 """Init command module"""
 import json
-import time
 import typer
-import questionary
 from pathlib import Path
 from datetime import datetime
-from typing import Optional, Dict, Any
-from collections import OrderedDict
-from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
-from rich.live import Live
+from contextlib import contextmanager
+from typing import TYPE_CHECKING, Optional, Dict, Any, Callable, Iterator
 
 from ui.logo import show_logo
 from ui.components import (
@@ -18,30 +14,33 @@ from ui.components import (
     console
 )
 from ui.colors import get_colors
-from core.utils.version_checker import check_for_updates
+from core.utils.version_checker import check_for_updates, prefetch_latest_version
 from core.version import __version__
 from core.utils import ProjectConfig
-from core.project_generator import ProjectGenerator
+
+if TYPE_CHECKING:
+    import questionary
 
 
 # ============================================================================
 # Constants
 # ============================================================================
 
+# Select choices as (label, value) pairs; labels are decorative only
 DATABASE_CHOICES = [
-    "PostgreSQL (Recommended)",
-    "MySQL", 
-    "SQLite (Development/Small Projects)"
+    ("PostgreSQL (Recommended)", "PostgreSQL"),
+    ("MySQL", "MySQL"),
+    ("SQLite (Development/Small Projects)", "SQLite")
 ]
 
 ORM_CHOICES = [
-    "SQLModel (Recommended)",
-    "SQLAlchemy"
+    ("SQLModel (Recommended)", "SQLModel"),
+    ("SQLAlchemy", "SQLAlchemy")
 ]
 
 AUTH_CHOICES = [
-    "Complete JWT Auth (Recommended)",
-    "Basic JWT Auth (login/register only)"
+    ("Complete JWT Auth (Recommended)", "Complete JWT Auth"),
+    ("Basic JWT Auth (login/register only)", "Basic JWT Auth")
 ]
 
 DEFAULT_NON_INTERACTIVE_CONFIG = {
@@ -64,13 +63,66 @@ DEFAULT_NON_INTERACTIVE_CONFIG = {
 }
 
 
+# ============================================================================
+# Display Markup
+# ============================================================================
+# The color scheme is fixed for the process, so static markup is built once
+
+_COLORS = get_colors()
+
+SUMMARY_LABELS = {
+    label: f"[bold {color}]{label}:[/bold {color}] "
+    for label, color in (
+        ("Project", _COLORS.primary_light),
+        ("Database", _COLORS.primary_light),
+        ("Migration", _COLORS.primary_light),
+        ("Authentication", _COLORS.primary),
+        ("Cache & Queues", _COLORS.warning),
+        ("Security", _COLORS.neon_green),
+        ("Dev Tools", _COLORS.secondary),
+        ("Testing", _COLORS.info),
+        ("Deployment", _COLORS.accent),
+    )
+}
+
+EMAIL_WARNING_CONTENT = (
+    f"[bold {_COLORS.warning}]⚠️  Important: Configure Email Service[/bold {_COLORS.warning}]\n\n"
+    f"[{_COLORS.text_muted}]Before running the application, update these settings in .env:[/{_COLORS.text_muted}]\n\n"
+    f"[{_COLORS.secondary}]  SMTP_HOST=smtp.gmail.com[/{_COLORS.secondary}]\n"
+    f"[{_COLORS.secondary}]  SMTP_PORT=587[/{_COLORS.secondary}]\n"
+    f"[{_COLORS.secondary}]  SMTP_USER=your-email@gmail.com[/{_COLORS.secondary}]\n"
+    f"[{_COLORS.secondary}]  SMTP_PASSWORD=your-app-password[/{_COLORS.secondary}]\n"
+    f"[{_COLORS.secondary}]  EMAILS_FROM_EMAIL=noreply@yourdomain.com[/{_COLORS.secondary}]\n\n"
+    f"[{_COLORS.text_muted}]For Gmail: https://support.google.com/accounts/answer/185833[/{_COLORS.text_muted}]"
+)
+
+NEXT_STEPS_HEADER = (
+    f"[bold {_COLORS.neon_green}]:white_check_mark:[/bold {_COLORS.neon_green}]  "
+    f"[bold {_COLORS.text_primary}]Project created successfully!"
+    f"[/bold {_COLORS.text_primary}]\n\n"
+    f"[{_COLORS.text_muted}]Project location:[/{_COLORS.text_muted}]\n"
+)
+
+NEXT_STEPS_COMMANDS = (
+    f"[bold {_COLORS.secondary}]uv sync[/bold {_COLORS.secondary}]  [{_COLORS.text_muted}]# Install dependencies[/{_COLORS.text_muted}]\n"
+    f"[bold {_COLORS.neon_green}]uv run uvicorn app.main:app --reload[/bold {_COLORS.neon_green}]  [{_COLORS.text_muted}]# Start server[/{_COLORS.text_muted}]"
+)
+
+CELERY_NEXT_STEPS = (
+    f"\n\n[{_COLORS.text_muted}]For background tasks (Celery):[/{_COLORS.text_muted}]\n"
+    f"[bold {_COLORS.warning}]uv run celery -A app.core.celery.celery_app worker --loglevel=info[/bold {_COLORS.warning}]  [{_COLORS.text_muted}]# Start Celery worker[/{_COLORS.text_muted}]\n"
+    f"[bold {_COLORS.secondary}]uv run celery -A app.core.celery.celery_app flower[/bold {_COLORS.secondary}]  [{_COLORS.text_muted}]# Start monitoring (optional)[/{_COLORS.text_muted}]"
+)
+
+
 # ============================================================================
 # Helper Functions
 # ============================================================================
 
-def extract_choice(choice: str, default: str = "") -> str:
-    """Extract actual value from choice (remove description in parentheses)"""
-    return choice.split(" (")[0] if choice else default
+def build_choices(choices: list[tuple[str, str]]) -> list["questionary.Choice"]:
+    """Build questionary choices from (label, value) pairs"""
+    import questionary
+    return [questionary.Choice(title, value=value) for title, value in choices]
 
 
 def get_auth_config(auth_type: str) -> Dict[str, Any]:
@@ -93,7 +145,7 @@ def get_auth_config(auth_type: str) -> Dict[str, Any]:
 # Configuration Collection
 # ============================================================================
 
-def collect_project_name(name: Optional[str], style: questionary.Style) -> tuple[str, bool]:
+def collect_project_name(name: Optional[str], style: "questionary.Style") -> tuple[str, bool]:
     """Collect project name
     
     If user inputs '.', use current directory name as project name.
@@ -101,6 +153,8 @@ def collect_project_name(name: Optional[str], style: questionary.Style) -> tuple
     Returns:
         (project_name, use_current_dir)
     """
+    import questionary
+    
     if name:
         if name == ".":
             return Path.cwd().name, True
@@ -117,21 +171,21 @@ def collect_project_name(name: Optional[str], style: questionary.Style) -> tuple
     return result, False
 
 
-def collect_database_config(style: questionary.Style) -> tuple[str, str, Optional[str]]:
+def collect_database_config(style: "questionary.Style") -> tuple[str, str, Optional[str]]:
     """Collect database configuration
     
     Returns:
         (database_type, orm_type, migration_tool)
     """
-    database = extract_choice(
-        questionary.select("Database:", choices=DATABASE_CHOICES, style=style).ask(),
-        "PostgreSQL"
-    )
+    import questionary
     
-    orm = extract_choice(
-        questionary.select("ORM:", choices=ORM_CHOICES, style=style).ask(),
-        "SQLModel"
-    )
+    database = questionary.select(
+        "Database:", choices=build_choices(DATABASE_CHOICES), style=style
+    ).ask() or "PostgreSQL"
+    
+    orm = questionary.select(
+        "ORM:", choices=build_choices(ORM_CHOICES), style=style
+    ).ask() or "SQLModel"
     
     enable_migration = questionary.confirm(
         "Enable database migrations (Alembic)?",
@@ -144,11 +198,13 @@ def collect_database_config(style: questionary.Style) -> tuple[str, str, Optiona
     return database, orm, migration_tool
 
 
-def collect_features(style: questionary.Style) -> Dict[str, Any]:
+def collect_features(style: "questionary.Style") -> Dict[str, Any]:
     """Collect feature configuration"""
+    import questionary
+    
     auth_choice = questionary.select(
         "Authentication:",
-        choices=AUTH_CHOICES,
+        choices=build_choices(AUTH_CHOICES),
         style=style
     ).ask()
     
@@ -195,7 +251,7 @@ def collect_features(style: questionary.Style) -> Dict[str, Any]:
 # Project Handling
 # ============================================================================
 
-def handle_existing_project(name: str, style: questionary.Style, use_current_dir: bool = False) -> bool:
+def handle_existing_project(name: str, style: "questionary.Style", use_current_dir: bool = False) -> bool:
     """Handle existing project
     
     Args:
@@ -206,6 +262,8 @@ def handle_existing_project(name: str, style: questionary.Style, use_current_dir
     Returns:
         True to continue, False to cancel
     """
+    import questionary
+    
     colors = get_colors()
     console.print()
     console.print(
@@ -290,22 +348,21 @@ def build_project_config(name: str, database: str, orm: str, migration_tool: Opt
     }
 
 
-def save_config_file(project_path: Path, config: Dict[str, Any]) -> None:
-    """Save configuration file to .forge/config.json"""
-    # Create .forge directory
+def save_config_file(project_path: Path, config: Dict[str, Any]) -> Dict[str, Any]:
+    """Save configuration file to .forge/config.json
+    
+    Returns:
+        The configuration as written, including metadata
+    """
+    # Create .forge directory (and the project directory if it is new)
     forge_dir = project_path / ".forge"
     forge_dir.mkdir(parents=True, exist_ok=True)
     
     # Build configuration in init interaction order
-    ordered_config = OrderedDict()
-    ordered_config["project_name"] = config.get("project_name")
-    
+    ordered_config = {"project_name": config.get("project_name")}
     if "database" in config:
         ordered_config["database"] = config["database"]
-    
     ordered_config["features"] = config.get("features")
-    
-    # Add metadata
     ordered_config["metadata"] = {
         "created_at": datetime.now().isoformat(),
         "forge_version": __version__
@@ -313,20 +370,40 @@ def save_config_file(project_path: Path, config: Dict[str, Any]) -> None:
     
     # Save configuration file
     config_file = forge_dir / "config.json"
-    with open(config_file, 'w', encoding='utf-8') as f:
-        json.dump(ordered_config, f, indent=2, ensure_ascii=False)
+    config_file.write_bytes(
+        json.dumps(ordered_config, indent=2, ensure_ascii=False).encode('utf-8')
+    )
+    return ordered_config
 
 
-def generate_project(project_path: Path, config: Dict[str, Any]) -> None:
-    """generate project structure and code"""
+def generate_project(
+    project_path: Path,
+    config: Dict[str, Any],
+    on_step: Optional[Callable[[str], None]] = None
+) -> None:
+    """generate project structure and code
+    
+    Args:
+        project_path: Project root directory path
+        config: Project configuration dictionary
+        on_step: Optional callback invoked with a description before each step
+    """
+    from core.project_generator import ProjectGenerator
+    
+    report_step = on_step or (lambda _description: None)
     try:
         # Save configuration file to .forge/config.json
-        save_config_file(project_path, config)
+        report_step("Saving configuration")
+        saved_config = save_config_file(project_path, config)
         
-        # Call ProjectGenerator to generate project structure
+        # Call ProjectGenerator to generate project structure, reusing the
+        # configuration just written instead of reading it back from disk
+        report_step("Validating configuration")
         generator = ProjectGenerator(project_path)
-        generator.config_reader.load_config()
+        generator.config_reader.set_config(saved_config)
         generator.config_reader.validate_config()
+        
+        report_step("Generating project files")
         generator.generate()
         
     except Exception as e:
@@ -338,9 +415,24 @@ def generate_project(project_path: Path, config: Dict[str, Any]) -> None:
 # Progress and Display
 # ============================================================================
 
-def show_saving_progress(name: str) -> None:
-    """Show progress for saving configuration and generating project"""
+@contextmanager
+def show_saving_progress(name: str) -> Iterator[Callable[[str], None]]:
+    """Show progress while the project is being saved and generated
+    
+    Yields a callback that starts a new step; the current step is shown
+    with an indeterminate bar until the next step starts or the block exits.
+    When output is not a terminal, a single status line is printed instead.
+    """
     colors = get_colors()
+    
+    # Nobody watches an animation in piped or CI output
+    if not console.is_terminal:
+        console.print(f"Generating project '{name}'...")
+        yield lambda _description: None
+        return
+    
+    from rich.progress import Progress, SpinnerColumn, TextColumn, BarColumn
+    
     create_gradient_bar("rainbow")
 
     progress = Progress(
@@ -359,49 +451,45 @@ def show_saving_progress(name: str) -> None:
         transient=True
     )
 
-    steps = [
-        "Creating project directory",
-        "Saving configuration",
-        "Creating project structure",
-        "Generating code files",
-        "Generating configuration files"
-    ]
+    # One indeterminate task whose description follows the current step
+    task = progress.add_task("", total=None)
 
-    with Live(progress, refresh_per_second=10):
-        for step in steps:
-            task = progress.add_task(step, total=100)
-            for _ in range(100):
-                progress.update(task, advance=1)
-                time.sleep(0.008)
-            progress.remove_task(task)
+    def start_step(description: str) -> None:
+        progress.update(task, description=description)
+
+    with progress:
+        yield start_step
 
 
 def build_config_summary_lines(name: str, database: str, orm: str, migration_tool: Optional[str], features: Dict[str, Any]) -> list[str]:
     """Build configuration summary lines"""
-    colors = get_colors()
+    colors = _COLORS
+    
+    # Pull feature flags out once
+    auth_config = features.get("auth") or {}
+    is_complete_auth = auth_config.get("type") == "complete"
+    redis_enabled = features.get("redis", False)
+    celery_enabled = features.get("celery", False)
+    
     lines = [
-        f"[bold {colors.primary_light}]Project:[/bold {colors.primary_light}] "
-        f"[bold {colors.text_primary}]{name}[/bold {colors.text_primary}]",
-        f"[bold {colors.primary_light}]Database:[/bold {colors.primary_light}] "
-        f"[{colors.secondary}]{database} with {orm}[/{colors.secondary}]"
+        SUMMARY_LABELS["Project"]
+        + f"[bold {colors.text_primary}]{name}[/bold {colors.text_primary}]",
+        SUMMARY_LABELS["Database"]
+        + f"[{colors.secondary}]{database} with {orm}[/{colors.secondary}]"
     ]
     
     if migration_tool:
         lines.append(
-            f"[bold {colors.primary_light}]Migration:[/bold {colors.primary_light}] "
-            f"[{colors.secondary}]{migration_tool}[/{colors.secondary}]"
+            SUMMARY_LABELS["Migration"]
+            + f"[{colors.secondary}]{migration_tool}[/{colors.secondary}]"
         )
 
     # Authentication configuration
-    auth_config = features.get("auth", {})
-    auth_type = "Complete JWT Auth" if auth_config.get("type") == "complete" else "Basic JWT Auth"
+    auth_type = "Complete JWT Auth" if is_complete_auth else "Basic JWT Auth"
     refresh_token = " (with Refresh Token)" if auth_config.get("refresh_token") else ""
-    lines.append(
-        f"[bold {colors.primary}]Authentication:[/bold {colors.primary}] "
-        f"[dim]{auth_type}{refresh_token}[/dim]"
-    )
+    lines.append(SUMMARY_LABELS["Authentication"] + f"[dim]{auth_type}{refresh_token}[/dim]")
     
-    if auth_config.get("type") == "complete":
+    if is_complete_auth:
         auth_features = auth_config.get("features", [])
         if auth_features:
             lines.append(
@@ -409,9 +497,6 @@ def build_config_summary_lines(name: str, database: str, orm: str, migration_too
             )
 
     # Redis and Celery configuration
-    redis_enabled = features.get("redis", False)
-    celery_enabled = features.get("celery", False)
-    
     if redis_enabled or celery_enabled:
         cache_queue_items = []
         if redis_enabled:
@@ -419,134 +504,92 @@ def build_config_summary_lines(name: str, database: str, orm: str, migration_too
         if celery_enabled:
             cache_queue_items.append("Celery")
         
-        lines.append(
-            f"[bold {colors.warning}]Cache & Queues:[/bold {colors.warning}] "
-            f"[dim]{', '.join(cache_queue_items)}[/dim]"
-        )
+        lines.append(SUMMARY_LABELS["Cache & Queues"] + f"[dim]{', '.join(cache_queue_items)}[/dim]")
 
     # Security configuration
     security_items = ["Input Validation", "Password Hashing"]
     if features.get("cors"):
         security_items.insert(0, "CORS")
     
-    lines.append(
-        f"[bold {colors.neon_green}]Security:[/bold {colors.neon_green}] "
-        f"[dim]{', '.join(security_items)}[/dim]"
-    )
+    lines.append(SUMMARY_LABELS["Security"] + f"[dim]{', '.join(security_items)}[/dim]")
 
     # Development tools
     if features.get("dev_tools"):
-        lines.append(
-            f"[bold {colors.secondary}]Dev Tools:[/bold {colors.secondary}] "
-            f"[dim]API Docs, Black, Ruff[/dim]"
-        )
+        lines.append(SUMMARY_LABELS["Dev Tools"] + "[dim]API Docs, Black, Ruff[/dim]")
 
     # Testing
     if features.get("testing"):
-        lines.append(
-            f"[bold {colors.info}]Testing:[/bold {colors.info}] "
-            f"[dim]pytest, httpx, coverage[/dim]"
-        )
+        lines.append(SUMMARY_LABELS["Testing"] + "[dim]pytest, httpx, coverage[/dim]")
 
     # Deployment
     if features.get("docker"):
-        lines.append(
-            f"[bold {colors.accent}]Deployment:[/bold {colors.accent}] "
-            f"[dim]Docker, Docker Compose[/dim]"
-        )
+        lines.append(SUMMARY_LABELS["Deployment"] + "[dim]Docker, Docker Compose[/dim]")
     
     return lines
 
 
 def show_config_summary(name: str, database: str, orm: str, migration_tool: Optional[str], features: Dict[str, Any]) -> None:
     """Show configuration summary"""
-    colors = get_colors()
     console.print()
 
     lines = build_config_summary_lines(name, database, orm, migration_tool, features)
     panel = create_highlighted_panel(
         "\n".join(lines),
         title="Configuration Summary",
-        accent_color=colors.neon_pink,
+        accent_color=_COLORS.neon_pink,
         icon=":package:"
     )
     console.print(panel)
     
     # Show email configuration warning for Complete JWT Auth
-    auth_config = features.get("auth", {})
-    if auth_config.get("type") == "complete":
+    if (features.get("auth") or {}).get("type") == "complete":
         show_email_config_warning()
 
 
 def show_email_config_warning() -> None:
     """Show email configuration warning"""
-    colors = get_colors()
     console.print()
-    warning_content = (
-        f"[bold {colors.warning}]⚠️  Important: Configure Email Service[/bold {colors.warning}]\n\n"
-        f"[{colors.text_muted}]Before running the application, update these settings in .env:[/{colors.text_muted}]\n\n"
-        f"[{colors.secondary}]  SMTP_HOST=smtp.gmail.com[/{colors.secondary}]\n"
-        f"[{colors.secondary}]  SMTP_PORT=587[/{colors.secondary}]\n"
-        f"[{colors.secondary}]  SMTP_USER=your-email@gmail.com[/{colors.secondary}]\n"
-        f"[{colors.secondary}]  SMTP_PASSWORD=your-app-password[/{colors.secondary}]\n"
-        f"[{colors.secondary}]  EMAILS_FROM_EMAIL=noreply@yourdomain.com[/{colors.secondary}]\n\n"
-        f"[{colors.text_muted}]For Gmail: https://support.google.com/accounts/answer/185833[/{colors.text_muted}]"
-    )
     warning_panel = create_highlighted_panel(
-        warning_content,
+        EMAIL_WARNING_CONTENT,
         title="Email Configuration",
-        accent_color=colors.warning,
+        accent_color=_COLORS.warning,
         icon="⚠️"
     )
     console.print(warning_panel)
 
 
-def show_next_steps(name: str, features: Dict[str, Any], use_current_dir: bool = False) -> None:
+def show_next_steps(name: str, features: Dict[str, Any], project_path: Path, use_current_dir: bool = False) -> None:
     """Show next steps
     
     Args:
         name: Project name
         features: Project features configuration
+        project_path: Project root directory path
         use_current_dir: Whether project was created in current directory
     """
-    colors = get_colors()
+    colors = _COLORS
     console.print()
 
-    # Determine project location and cd command
+    # Determine cd command
     if use_current_dir:
-        project_location = Path.cwd()
         cd_line = ""  # No cd needed
     else:
-        project_location = Path.cwd() / name
         cd_line = f"[bold {colors.primary}]cd {name}[/bold {colors.primary}]\n"
 
     content = (
-        f"[bold {colors.neon_green}]:white_check_mark:[/bold {colors.neon_green}]  "
-        f"[bold {colors.text_primary}]Project created successfully!"
-        f"[/bold {colors.text_primary}]\n\n"
-        f"[{colors.text_muted}]Project location:[/{colors.text_muted}]\n"
-        f"[bold {colors.secondary}]{project_location}[/bold {colors.secondary}]\n\n"
-        f"[{colors.text_muted}]Next steps:[/{colors.text_muted}]\n"
-        f"{cd_line}"
-        f"[bold {colors.secondary}]uv sync[/bold {colors.secondary}]  [{colors.text_muted}]# Install dependencies[/{colors.text_muted}]\n"
-        f"[bold {colors.neon_green}]uv run uvicorn app.main:app --reload[/bold {colors.neon_green}]  [{colors.text_muted}]# Start server[/{colors.text_muted}]"
+        NEXT_STEPS_HEADER
+        + f"[bold {colors.secondary}]{project_path}[/bold {colors.secondary}]\n\n"
+        + f"[{colors.text_muted}]Next steps:[/{colors.text_muted}]\n"
+        + cd_line
+        + NEXT_STEPS_COMMANDS
     )
     
-    # Add Celery instructions if enabled
+    # Add Celery instructions if enabled (dict is the legacy format)
     celery_enabled = features.get("celery", False)
-    if isinstance(celery_enabled, bool) and celery_enabled:
-        content += (
-            f"\n\n[{colors.text_muted}]For background tasks (Celery):[/{colors.text_muted}]\n"
-            f"[bold {colors.warning}]uv run celery -A app.core.celery.celery_app worker --loglevel=info[/bold {colors.warning}]  [{colors.text_muted}]# Start Celery worker[/{colors.text_muted}]\n"
-            f"[bold {colors.secondary}]uv run celery -A app.core.celery.celery_app flower[/bold {colors.secondary}]  [{colors.text_muted}]# Start monitoring (optional)[/{colors.text_muted}]"
-        )
-    elif isinstance(celery_enabled, dict) and celery_enabled.get("enabled", False):
-        # Support legacy format
-        content += (
-            f"\n\n[{colors.text_muted}]For background tasks (Celery):[/{colors.text_muted}]\n"
-            f"[bold {colors.warning}]uv run celery -A app.core.celery.celery_app worker --loglevel=info[/bold {colors.warning}]  [{colors.text_muted}]# Start Celery worker[/{colors.text_muted}]\n"
-            f"[bold {colors.secondary}]uv run celery -A app.core.celery.celery_app flower[/bold {colors.secondary}]  [{colors.text_muted}]# Start monitoring (optional)[/{colors.text_muted}]"
-        )
+    if isinstance(celery_enabled, dict):
+        celery_enabled = celery_enabled.get("enabled", False)
+    if celery_enabled is True:
+        content += CELERY_NEXT_STEPS
 
     panel = create_highlighted_panel(
         content,
@@ -564,24 +607,21 @@ def show_next_steps(name: str, features: Dict[str, Any], use_current_dir: bool =
 
 def execute_init(name: Optional[str] = None, interactive: bool = True) -> Dict[str, Any]:
     """Execute init command"""
+    prefetch_latest_version()
     show_logo()
     
     # Check for updates at the start of init command (interactive mode)
     check_for_updates(silent=False, interactive=interactive)
     
     style = create_questionary_style()
+    user_cwd = Path.cwd()
 
     if interactive:
         # Interactive mode
         name, use_current_dir = collect_project_name(name, style)
         
         # Check if project already exists
-        user_cwd = Path.cwd()
-        if use_current_dir:
-            project_path = user_cwd
-        else:
-            project_path = user_cwd / name
-        
+        project_path = user_cwd if use_current_dir else user_cwd / name
         if ProjectConfig.exists(project_path):
             handle_existing_project(name, style, use_current_dir=use_current_dir)
         
@@ -592,31 +632,25 @@ def execute_init(name: Optional[str] = None, interactive: bool = True) -> Dict[s
         name = name or "my-fastapi-project"
         use_current_dir = (name == ".")
         if name == ".":
-            name = Path.cwd().name
+            name = user_cwd.name
         database = DEFAULT_NON_INTERACTIVE_CONFIG["database"]
         orm = DEFAULT_NON_INTERACTIVE_CONFIG["orm"]
         migration_tool = DEFAULT_NON_INTERACTIVE_CONFIG["migration_tool"]
         features = DEFAULT_NON_INTERACTIVE_CONFIG["features"]
-        user_cwd = Path.cwd()
+        # Determine project path - use current directory if requested
+        project_path = user_cwd if use_current_dir else user_cwd / name
 
     # Build project configuration
     project_config = build_project_config(name, database, orm, migration_tool, features)
     
-    # Show saving progress
-    show_saving_progress(name)
-
-    # Determine project path - use current directory if requested
-    if use_current_dir:
-        project_path = user_cwd  # Use current directory directly
-    else:
-        project_path = user_cwd / name
-        project_path.mkdir(parents=True, exist_ok=True)
-    
-    generate_project(project_path, project_config)
+    # Generate project while showing progress
+    # (save_config_file creates the project directory along with .forge/)
+    with show_saving_progress(name) as start_step:
+        generate_project(project_path, project_config, on_step=start_step)
 
     # Show configuration summary and next steps
     show_config_summary(name, database, orm, migration_tool, features)
-    show_next_steps(name, features, use_current_dir=use_current_dir)
+    show_next_steps(name, features, project_path, use_current_dir=use_current_dir)
 
     return {
         "project_name": name,
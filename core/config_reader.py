@@ -3,6 +3,9 @@ import json
 from pathlib import Path
 from typing import Dict, Any, Optional
 
+# Characters replaced with "_" when deriving the project identifier
+_IDENTIFIER_TABLE = str.maketrans({'-': '_', ' ': '_'})
+
 
 class ConfigValidationError(Exception):
     """Configuration validation error"""
@@ -31,6 +34,21 @@ class ConfigReader:
         self.config: Optional[Dict[str, Any]] = None
         self.config_file = self.project_path / ".forge" / "config.json"
         
+        # Parsed configuration fields, populated by _parse_config()
+        self._features: Dict[str, Any] = {}
+        self._project_identifier = ""
+        self._db_config: Optional[Dict[str, str]] = None
+        self._auth_type: Optional[str] = None
+        self._refresh_token = False
+        self._has_cors = False
+        self._has_dev_tools = False
+        self._has_testing = False
+        self._has_docker = False
+        self._has_redis = False
+        self._redis_features: list = []
+        self._has_celery = False
+        self._celery_features: list = []
+        
     def load_config(self) -> Dict[str, Any]:
         """Load configuration from .forge/config.json
         
@@ -48,15 +66,63 @@ class ConfigReader:
             )
         
         try:
-            with open(self.config_file, 'r', encoding='utf-8') as f:
-                self.config = json.load(f)
+            self.config = json.loads(self.config_file.read_bytes())
         except json.JSONDecodeError as e:
             raise ConfigValidationError(
                 f"Invalid JSON in configuration file: {e}"
             )
         
+        self._parse_config()
         return self.config
     
+    def set_config(self, config: Dict[str, Any]) -> "ConfigReader":
+        """Use an in-memory configuration instead of reading config.json
+        
+        Args:
+            config: Configuration dictionary
+            
+        Returns:
+            This configuration reader
+        """
+        self.config = config
+        self._parse_config()
+        return self
+    
+    def _parse_config(self) -> None:
+        """Parse loaded configuration once into cached fields"""
+        features = self.config.get('features') or {}
+        auth_config = features.get('auth') or {}
+        
+        self._features = features
+        # Project name normalized for identifiers (database name, JWT issuer)
+        self._project_identifier = self.get_project_name().lower().translate(_IDENTIFIER_TABLE)
+        self._db_config = self.config.get('database')
+        self._auth_type = auth_config.get('type')
+        self._refresh_token = auth_config.get('refresh_token', False)
+        self._has_cors = features.get('cors', False)
+        self._has_dev_tools = features.get('dev_tools', False)
+        self._has_testing = features.get('testing', False)
+        self._has_docker = features.get('docker', False)
+        
+        # Redis and Celery support both boolean and object format
+        redis_config = features.get('redis', False)
+        if isinstance(redis_config, bool):
+            self._has_redis = redis_config
+            self._redis_features = ["caching", "sessions", "queues"] if redis_config else []
+        else:
+            self._has_redis = redis_config.get('enabled', False)
+            self._redis_features = redis_config.get('features', [])
+        
+        celery_config = features.get('celery', False)
+        if isinstance(celery_config, bool):
+            self._has_celery = celery_config
+            self._celery_features = (
+                ["background_tasks", "scheduled_tasks", "task_monitoring"] if celery_config else []
+            )
+        else:
+            self._has_celery = celery_config.get('enabled', False)
+            self._celery_features = celery_config.get('features', [])
+    
     def validate_config(self) -> bool:
         """Validate configuration file integrity
         
@@ -138,12 +204,15 @@ class ConfigReader:
         """Get project name"""
         return self.config.get('project_name', 'my-project')
     
+    def get_project_identifier(self) -> str:
+        """Get project name normalized for use as an identifier"""
+        return self._project_identifier
+    
     def get_database_config(self) -> Dict[str, str]:
         """Get database configuration"""
-        db_config = self.config.get('database')
-        if not db_config:
+        if not self._db_config:
             raise ConfigValidationError("Database configuration is required")
-        return db_config
+        return self._db_config
     
     def get_database_type(self) -> str:
         """Get database type"""
@@ -163,7 +232,7 @@ class ConfigReader:
     
     def get_features(self) -> Dict[str, Any]:
         """Get feature configuration"""
-        return self.config.get('features', {})
+        return self._features
     
     def has_auth(self) -> bool:
         """Check if authentication is enabled (authentication is now required)"""
@@ -171,66 +240,47 @@ class ConfigReader:
     
     def get_auth_type(self) -> str:
         """Get authentication type"""
-        features = self.get_features()
-        auth_config = features.get('auth', {})
-        auth_type = auth_config.get('type')
-        if not auth_type or auth_type == 'none':
+        if not self._auth_type or self._auth_type == 'none':
             raise ConfigValidationError(
                 "Authentication is required but not configured"
             )
-        return auth_type
+        return self._auth_type
     
     def has_refresh_token(self) -> bool:
         """Check if Refresh Token is enabled"""
-        features = self.get_features()
-        auth_config = features.get('auth', {})
-        return auth_config.get('refresh_token', False)
+        return self._refresh_token
     
     def has_cors(self) -> bool:
         """Check if CORS is enabled"""
-        return self.get_features().get('cors', False)
+        return self._has_cors
     
     def has_dev_tools(self) -> bool:
         """Check if development tools are included"""
-        return self.get_features().get('dev_tools', False)
+        return self._has_dev_tools
     
     def has_testing(self) -> bool:
         """Check if testing tools are included"""
-        return self.get_features().get('testing', False)
+        return self._has_testing
     
     def has_docker(self) -> bool:
         """Check if Docker configuration is included"""
-        return self.get_features().get('docker', False)
+        return self._has_docker
     
     def has_redis(self) -> bool:
         """Check if Redis is enabled"""
-        redis_config = self.get_features().get('redis', False)
-        # Support both boolean and object format
-        if isinstance(redis_config, bool):
-            return redis_config
-        return redis_config.get('enabled', False)
+        return self._has_redis
     
     def get_redis_features(self) -> list:
         """Get Redis features list"""
-        redis_config = self.get_features().get('redis', {})
-        if isinstance(redis_config, bool):
-            return ["caching", "sessions", "queues"] if redis_config else []
-        return redis_config.get('features', [])
+        return self._redis_features
     
     def has_celery(self) -> bool:
         """Check if Celery is enabled"""
-        celery_config = self.get_features().get('celery', False)
-        # Support both boolean and object format
-        if isinstance(celery_config, bool):
-            return celery_config
-        return celery_config.get('enabled', False)
+        return self._has_celery
     
     def get_celery_features(self) -> list:
         """Get Celery features list"""
-        celery_config = self.get_features().get('celery', {})
-        if isinstance(celery_config, bool):
-            return ["background_tasks", "scheduled_tasks", "task_monitoring"] if celery_config else []
-        return celery_config.get('features', [])
+        return self._celery_features
     
     def get_metadata(self) -> Optional[Dict[str, Any]]:
         """Get metadata information"""
@@ -1,5 +1,6 @@
 """Celery configuration generator"""
 from pathlib import Path
+from typing import Optional
 from core.decorators import Generator
 from core.utils import FileOperations
 from core.config_reader import ConfigReader
@@ -15,16 +16,22 @@ from core.config_reader import ConfigReader
 class CeleryConfigGenerator:
     """Celery configuration generator"""
     
-    def __init__(self, project_path: Path, config_reader: ConfigReader):
+    def __init__(
+        self,
+        project_path: Path,
+        config_reader: ConfigReader,
+        file_ops: Optional[FileOperations] = None
+    ):
         """Initialize Celery config generator
         
         Args:
             project_path: Project root directory path
             config_reader: Configuration reader instance
+            file_ops: Shared file operations; a new instance is created if omitted
         """
         self.project_path = Path(project_path)
         self.config_reader = config_reader
-        self.file_ops = FileOperations(base_path=project_path)
+        self.file_ops = file_ops or FileOperations(base_path=project_path)
     
     def generate(self) -> None:
         """Generate Celery configuration"""
@@ -297,10 +297,9 @@ JWT_AUDIENCE=demo_users
         # generate a random secret key for development
         import secrets
         secret_key = secrets.token_urlsafe(32)
-        project_name = self.config_reader.get_project_name()
         
-        # Generate project identifier (for issuer and audience) - same logic as jwt.py
-        project_identifier = project_name.lower().replace('-', '_').replace(' ', '_')
+        # Project identifier (for issuer and audience), shared with jwt.py
+        project_identifier = self.config_reader.get_project_identifier()
         
         content = f'''# ============================================
 # Authentication Configuration
@@ -1,37 +1,11 @@
 """gitignore generategenerator"""
+from typing import Final
 from core.decorators import Generator
 from ..templates.base import BaseTemplateGenerator
 
 
-@Generator(
-    category="config",
-    priority=3,
-    description="Generate .gitignore file"
-)
-class GitignoreGenerator(BaseTemplateGenerator):
-    """gitignore File generator"""
-    
-    def generate(self) -> None:
-        """generate .gitignore file"""
-        content = self._build_python_section()
-        content += self._build_venv_section()
-        content += self._build_ide_section()
-        content += self._build_env_section()
-        content += self._build_database_section()
-        content += self._build_testing_section()
-        content += self._build_tools_section()
-        content += self._build_os_section()
-        content += self._build_logs_section()
-        
-        self.file_ops.create_file(
-            file_path=".gitignore",
-            content=content,
-            overwrite=True
-        )
-    
-    def _build_python_section(self) -> str:
-        """Build Python related ignore rules"""
-        return '''# Python
+# Ignore rules by section; none depend on the project config
+_PYTHON_SECTION: Final[str] = '''# Python
 __pycache__/
 *.py[cod]
 *$py.class
@@ -54,20 +28,16 @@ wheels/
 *.egg
 
 '''
-    
-    def _build_venv_section(self) -> str:
-        """Buildvirtual environment ignore rules"""
-        return '''# Virtual Environment
+
+_VENV_SECTION: Final[str] = '''# Virtual Environment
 .venv/
 venv/
 ENV/
 env/
 
 '''
-    
-    def _build_ide_section(self) -> str:
-        """Build IDE ignore rules"""
-        return '''# IDE
+
+_IDE_SECTION: Final[str] = '''# IDE
 .vscode/
 .idea/
 *.swp
@@ -75,10 +45,8 @@ env/
 *~
 
 '''
-    
-    def _build_env_section(self) -> str:
-        """Buildenvironment variablesignore rules"""
-        return '''# Environment Variables
+
+_ENV_SECTION: Final[str] = '''# Environment Variables
 .env
 .env.local
 .env.*.local
@@ -90,28 +58,22 @@ secret/.env.production
 !secret/.env.example
 
 '''
-    
-    def _build_database_section(self) -> str:
-        """Builddatabaseignore rules"""
-        return '''# Database
+
+_DATABASE_SECTION: Final[str] = '''# Database
 *.db
 *.sqlite3
 
 '''
-    
-    def _build_testing_section(self) -> str:
-        """Buildtestrelated ignore rules"""
-        return '''# Testing
+
+_TESTING_SECTION: Final[str] = '''# Testing
 .pytest_cache/
 .coverage
 htmlcov/
 .tox/
 
 '''
-    
-    def _build_tools_section(self) -> str:
-        """Buildutilityrelated ignore rules"""
-        return '''# MyPy
+
+_TOOLS_SECTION: Final[str] = '''# MyPy
 .mypy_cache/
 .dmypy.json
 dmypy.json
@@ -120,18 +82,44 @@ dmypy.json
 .ruff_cache/
 
 '''
-    
-    def _build_os_section(self) -> str:
-        """Buildoperating systemignore rules"""
-        return '''# OS
+
+_OS_SECTION: Final[str] = '''# OS
 .DS_Store
 Thumbs.db
 
 '''
-    
-    def _build_logs_section(self) -> str:
-        """Buildloggingignore rules"""
-        return '''# Logs
+
+_LOGS_SECTION: Final[str] = '''# Logs
 *.log
 logs/
 '''
+
+GITIGNORE_CONTENT: Final[str] = "".join([
+    _PYTHON_SECTION,
+    _VENV_SECTION,
+    _IDE_SECTION,
+    _ENV_SECTION,
+    _DATABASE_SECTION,
+    _TESTING_SECTION,
+    _TOOLS_SECTION,
+    _OS_SECTION,
+    _LOGS_SECTION,
+])
+GITIGNORE_CONTENT_BYTES: Final[bytes] = GITIGNORE_CONTENT.encode("utf-8")
+
+
+@Generator(
+    category="config",
+    priority=3,
+    description="Generate .gitignore file"
+)
+class GitignoreGenerator(BaseTemplateGenerator):
+    """gitignore File generator"""
+    
+    def generate(self) -> None:
+        """generate .gitignore file"""
+        self.file_ops.create_file_bytes(
+            file_path=".gitignore",
+            data=GITIGNORE_CONTENT_BYTES,
+            overwrite=True
+        )
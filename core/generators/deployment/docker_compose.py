@@ -1,8 +1,72 @@
 """Docker Compose generator"""
+from functools import lru_cache
+from typing import Final
 from core.decorators import Generator
 from ..templates.base import BaseTemplateGenerator
 
 
+_NETWORKS: Final[str] = '''networks:
+  app-network:
+    driver: bridge
+'''
+
+
+# Per-database compose fragments
+_DATABASE_URLS: Final[dict[str, str]] = {
+    "PostgreSQL": "postgresql+asyncpg://postgres:postgres@db:5432/{project_name}",
+    "MySQL": "mysql+aiomysql://root:mysql@db:3306/{project_name}",
+}
+
+
+_DATABASE_SERVICES: Final[dict[str, str]] = {
+    "PostgreSQL": '''  db:
+    image: postgres:15-alpine
+    container_name: {project_name}_db
+    environment:
+      - POSTGRES_USER=postgres
+      - POSTGRES_PASSWORD=postgres
+      - POSTGRES_DB={project_name}
+    ports:
+      - "5432:5432"
+    volumes:
+      - postgres_data:/var/lib/postgresql/data
+    restart: unless-stopped
+    networks:
+      - app-network
+    healthcheck:
+      test: ["CMD-SHELL", "pg_isready -U postgres"]
+      timeout: 20s
+      retries: 10
+
+''',
+    "MySQL": '''  db:
+    image: mysql:8.0
+    container_name: {project_name}_db
+    environment:
+      - MYSQL_ROOT_PASSWORD=mysql
+      - MYSQL_DATABASE={project_name}
+    ports:
+      - "3306:3306"
+    volumes:
+      - mysql_data:/var/lib/mysql
+    restart: unless-stopped
+    networks:
+      - app-network
+    healthcheck:
+      test: ["CMD", "mysqladmin", "ping", "-h", "localhost", "-u", "root", "-pmysql"]
+      timeout: 20s
+      retries: 10
+
+''',
+}
+
+
+_DATABASE_VOLUMES: Final[dict[str, str]] = {
+    "PostgreSQL": "postgres_data",
+    "MySQL": "mysql_data",
+}
+
+
 @Generator(
     category="deployment",
     priority=101,
@@ -15,10 +79,11 @@ class DockerComposeGenerator(BaseTemplateGenerator):
     
     def generate(self) -> None:
         """generate docker-compose.yml file"""
-        content = self._build_version()
-        content += self._build_services()
-        content += self._build_volumes()
-        content += self._build_networks()
+        content = "".join([
+            self._build_services(),
+            self._build_volumes(),
+            _NETWORKS,
+        ])
         
         self.file_ops.create_file(
             file_path="docker-compose.yml",
@@ -26,13 +91,15 @@ class DockerComposeGenerator(BaseTemplateGenerator):
             overwrite=True
         )
     
-    def _build_version(self) -> str:
-        """Build version declaration"""
-        return ''
-    
     def _build_services(self) -> str:
         """Build services configuration"""
-        content = '''services:
+        # Read the config once for every service below
+        project_name = self.config_reader.get_project_name()
+        db_type = self.config_reader.get_database_type()
+        has_redis = self.config_reader.has_redis()
+        has_celery = self.config_reader.has_celery()
+        
+        parts = ['''services:
   app:
     build: .
     container_name: {project_name}
@@ -42,129 +109,84 @@ class DockerComposeGenerator(BaseTemplateGenerator):
       - ./secret/.env.production
     environment:
       - ENV=production
-'''.format(project_name=self.config_reader.get_project_name())
+'''.format(project_name=project_name)]
         
         # Add database connection environment variables
-        db_type = self.config_reader.get_database_type()
-        if db_type == "PostgreSQL":
-            content += '''      - DATABASE_URL=postgresql+asyncpg://postgres:postgres@db:5432/{project_name}
-'''.format(project_name=self.config_reader.get_project_name())
-        elif db_type == "MySQL":
-            content += '''      - DATABASE_URL=mysql+aiomysql://root:mysql@db:3306/{project_name}
-'''.format(project_name=self.config_reader.get_project_name())
+        parts.append(self._build_database_url_env(project_name, db_type))
         
         # Add Redis environment variables if enabled
-        if self.config_reader.has_redis():
-            content += '''      - REDIS_CONNECTION_URL=redis://redis:6379
-'''
+        if has_redis:
+            parts.append('''      - REDIS_CONNECTION_URL=redis://redis:6379
+''')
         
         # Add Celery environment variables if enabled
-        if self.config_reader.has_celery():
-            content += '''      - CELERY_BROKER_URL=redis://redis:6379/1
+        if has_celery:
+            parts.append('''      - CELERY_BROKER_URL=redis://redis:6379/1
       - CELERY_RESULT_BACKEND=redis://redis:6379/2
-'''
+''')
         
         # Build dependencies with proper conditions
-        content += '''    volumes:
+        parts.append('''    volumes:
       - ./app:/app/app
     depends_on:
       db-migrate:
         condition: service_completed_successfully
-'''
+''')
         
-        if self.config_reader.has_redis():
-            content += '''      redis:
+        if has_redis:
+            parts.append('''      redis:
         condition: service_started
-'''
+''')
         
-        content += '''    restart: unless-stopped
+        parts.append('''    restart: unless-stopped
     networks:
       - app-network
 
-'''
+''')
         
         # Add database service
-        content += self._build_database_service()
+        parts.append(self._build_database_service(project_name, db_type))
         
         # Add database migration service
-        content += self._build_database_migration_service()
+        parts.append(self._build_database_migration_service(project_name, db_type))
         
         # Add Redis service if enabled
-        if self.config_reader.has_redis():
-            content += self._build_redis_service()
+        if has_redis:
+            parts.append(self._build_redis_service(project_name))
         
         # Add Celery services if enabled
-        if self.config_reader.has_celery():
-            content += self._build_celery_services()
+        if has_celery:
+            parts.append(self._build_celery_services(project_name, db_type))
         
-        return content
+        return "".join(parts)
     
-    def _build_database_service(self) -> str:
+    # Rendered per (project_name, db_type); the URL entry is reused by three services
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _build_database_url_env(project_name: str, db_type: str) -> str:
+        """Build DATABASE_URL environment entry for the database container"""
+        url = _DATABASE_URLS.get(db_type)
+        if url is None:
+            return ''
+        return f"      - DATABASE_URL={url.format(project_name=project_name)}\n"
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _build_database_service(project_name: str, db_type: str) -> str:
         """Build database service configuration"""
-        db_type = self.config_reader.get_database_type()
-        project_name = self.config_reader.get_project_name()
-        
-        if db_type == "PostgreSQL":
-            return '''  db:
-    image: postgres:15-alpine
-    container_name: {project_name}_db
-    environment:
-      - POSTGRES_USER=postgres
-      - POSTGRES_PASSWORD=postgres
-      - POSTGRES_DB={project_name}
-    ports:
-      - "5432:5432"
-    volumes:
-      - postgres_data:/var/lib/postgresql/data
-    restart: unless-stopped
-    networks:
-      - app-network
-    healthcheck:
-      test: ["CMD-SHELL", "pg_isready -U postgres"]
-      timeout: 20s
-      retries: 10
-
-'''.format(project_name=project_name)
-        
-        elif db_type == "MySQL":
-            return '''  db:
-    image: mysql:8.0
-    container_name: {project_name}_db
-    environment:
-      - MYSQL_ROOT_PASSWORD=mysql
-      - MYSQL_DATABASE={project_name}
-    ports:
-      - "3306:3306"
-    volumes:
-      - mysql_data:/var/lib/mysql
-    restart: unless-stopped
-    networks:
-      - app-network
-    healthcheck:
-      test: ["CMD", "mysqladmin", "ping", "-h", "localhost", "-u", "root", "-pmysql"]
-      timeout: 20s
-      retries: 10
-
-'''.format(project_name=project_name)
-        
-        return ''
+        template = _DATABASE_SERVICES.get(db_type)
+        if template is None:
+            return ''
+        return template.format(project_name=project_name)
     
-    def _build_database_migration_service(self) -> str:
+    def _build_database_migration_service(self, project_name: str, db_type: str) -> str:
         """Build database migration service configuration"""
-        project_name = self.config_reader.get_project_name()
-        
-        # Build environment variables
-        env_vars = '''      - ENV=production
-'''
-        
-        # Add database connection
-        db_type = self.config_reader.get_database_type()
-        if db_type == "PostgreSQL":
-            env_vars += '''      - DATABASE_URL=postgresql+asyncpg://postgres:postgres@db:5432/{project_name}
-'''.format(project_name=project_name)
-        elif db_type == "MySQL":
-            env_vars += '''      - DATABASE_URL=mysql+aiomysql://root:mysql@db:3306/{project_name}
-'''.format(project_name=project_name)
+        # Build environment variables with the database connection
+        env_vars = "".join([
+            '''      - ENV=production
+''',
+            self._build_database_url_env(project_name, db_type),
+        ])
         
         return '''  db-migrate:
     build: .
@@ -185,10 +207,8 @@ class DockerComposeGenerator(BaseTemplateGenerator):
 
 '''.format(project_name=project_name, env_vars=env_vars)
     
-    def _build_redis_service(self) -> str:
+    def _build_redis_service(self, project_name: str) -> str:
         """Build Redis service configuration"""
-        project_name = self.config_reader.get_project_name()
-        
         return '''  redis:
     image: redis:7-alpine
     container_name: {project_name}_redis
@@ -200,28 +220,18 @@ class DockerComposeGenerator(BaseTemplateGenerator):
 
 '''.format(project_name=project_name)
     
-    def _build_celery_services(self) -> str:
+    def _build_celery_services(self, project_name: str, db_type: str) -> str:
         """Build Celery services configuration"""
-        project_name = self.config_reader.get_project_name()
-        
-        # Build environment variables
-        env_vars = '''      - ENV=production
-'''
-        
-        # Add database connection
-        db_type = self.config_reader.get_database_type()
-        if db_type == "PostgreSQL":
-            env_vars += '''      - DATABASE_URL=postgresql+asyncpg://postgres:postgres@db:5432/{project_name}
-'''.format(project_name=project_name)
-        elif db_type == "MySQL":
-            env_vars += '''      - DATABASE_URL=mysql+aiomysql://root:mysql@db:3306/{project_name}
-'''.format(project_name=project_name)
-        
-        # Add Redis and Celery environment variables
-        env_vars += '''      - REDIS_CONNECTION_URL=redis://redis:6379
+        # Build environment variables: database, then Redis and Celery
+        env_vars = "".join([
+            '''      - ENV=production
+''',
+            self._build_database_url_env(project_name, db_type),
+            '''      - REDIS_CONNECTION_URL=redis://redis:6379
       - CELERY_BROKER_URL=redis://redis:6379/1
       - CELERY_RESULT_BACKEND=redis://redis:6379/2
-'''
+''',
+        ])
         
         # Build dependencies with proper conditions
         depends_on_str = '''      db-migrate:
@@ -262,25 +272,11 @@ class DockerComposeGenerator(BaseTemplateGenerator):
     
     def _build_volumes(self) -> str:
         """Build volumes configuration"""
-        db_type = self.config_reader.get_database_type()
-        
-        content = '''volumes:
-'''
+        parts = ['''volumes:
+''']
         
-        if db_type == "PostgreSQL":
-            content += '''  postgres_data:
-
-'''
-        elif db_type == "MySQL":
-            content += '''  mysql_data:
-
-'''
+        volume = _DATABASE_VOLUMES.get(self.config_reader.get_database_type())
+        if volume:
+            parts.append(f"  {volume}:\n\n")
         
-        return content
-    
-    def _build_networks(self) -> str:
-        """Build networks configuration"""
-        return '''networks:
-  app-network:
-    driver: bridge
-'''
+        return "".join(parts)
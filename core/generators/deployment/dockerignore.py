@@ -1,37 +1,11 @@
 """dockerignore generator"""
+from typing import Final
 from core.decorators import Generator
 from ..templates.base import BaseTemplateGenerator
 
 
-@Generator(
-    category="deployment",
-    priority=102,
-    enabled_when=lambda c: c.has_docker(),
-    description="Generate .dockerignore"
-)
-class DockerignoreGenerator(BaseTemplateGenerator):
-    """.dockerignore file generator"""
-    
-    def generate(self) -> None:
-        """generate .dockerignore file"""
-        content = self._build_python_section()
-        content += self._build_venv_section()
-        content += self._build_ide_section()
-        content += self._build_git_section()
-        content += self._build_env_section()
-        content += self._build_testing_section()
-        content += self._build_docs_section()
-        content += self._build_misc_section()
-        
-        self.file_ops.create_file(
-            file_path=".dockerignore",
-            content=content,
-            overwrite=True
-        )
-    
-    def _build_python_section(self) -> str:
-        """Build Python-related ignore rules"""
-        return '''# Python
+# Ignore rules by section; none depend on the project config
+_PYTHON_SECTION: Final[str] = '''# Python
 __pycache__
 *.py[cod]
 *$py.class
@@ -54,20 +28,16 @@ wheels
 *.egg
 
 '''
-    
-    def _build_venv_section(self) -> str:
-        """Build virtual environment ignore rules"""
-        return '''# Virtual Environment
+
+_VENV_SECTION: Final[str] = '''# Virtual Environment
 .venv
 venv
 ENV
 env
 
 '''
-    
-    def _build_ide_section(self) -> str:
-        """Build IDE ignore rules"""
-        return '''# IDE
+
+_IDE_SECTION: Final[str] = '''# IDE
 .vscode
 .idea
 *.swp
@@ -75,29 +45,23 @@ env
 *~
 
 '''
-    
-    def _build_git_section(self) -> str:
-        """Build Git ignore rules"""
-        return '''# Git
+
+_GIT_SECTION: Final[str] = '''# Git
 .git
 .gitignore
 .gitattributes
 
 '''
-    
-    def _build_env_section(self) -> str:
-        """Build environment variables ignore rules"""
-        return '''# Environment Variables
+
+_ENV_SECTION: Final[str] = '''# Environment Variables
 .env
 .env.*
 !.env.example
 !secret/.env.*
 
 '''
-    
-    def _build_testing_section(self) -> str:
-        """Build testing-related ignore rules"""
-        return '''# Testing
+
+_TESTING_SECTION: Final[str] = '''# Testing
 .pytest_cache
 .coverage
 htmlcov
@@ -105,19 +69,15 @@ htmlcov
 tests
 
 '''
-    
-    def _build_docs_section(self) -> str:
-        """Build documentation ignore rules"""
-        return '''# Documentation
+
+_DOCS_SECTION: Final[str] = '''# Documentation
 docs
 *.md
 !README.md
 
 '''
-    
-    def _build_misc_section(self) -> str:
-        """Build miscellaneous ignore rules"""
-        return '''# Misc
+
+_MISC_SECTION: Final[str] = '''# Misc
 .DS_Store
 Thumbs.db
 *.log
@@ -126,3 +86,33 @@ logs
 docker-compose.yml
 Dockerfile
 '''
+
+DOCKERIGNORE_CONTENT: Final[str] = "".join([
+    _PYTHON_SECTION,
+    _VENV_SECTION,
+    _IDE_SECTION,
+    _GIT_SECTION,
+    _ENV_SECTION,
+    _TESTING_SECTION,
+    _DOCS_SECTION,
+    _MISC_SECTION,
+])
+DOCKERIGNORE_CONTENT_BYTES: Final[bytes] = DOCKERIGNORE_CONTENT.encode("utf-8")
+
+
+@Generator(
+    category="deployment",
+    priority=102,
+    enabled_when=lambda c: c.has_docker(),
+    description="Generate .dockerignore"
+)
+class DockerignoreGenerator(BaseTemplateGenerator):
+    """.dockerignore file generator"""
+    
+    def generate(self) -> None:
+        """generate .dockerignore file"""
+        self.file_ops.create_file_bytes(
+            file_path=".dockerignore",
+            data=DOCKERIGNORE_CONTENT_BYTES,
+            overwrite=True
+        )
@@ -1,28 +1,131 @@
 """Generator orchestrator - automatically discovers and manages generators"""
+from functools import cached_property
+from importlib import import_module
 from pathlib import Path
-from typing import List
+from typing import Callable, Final, List, Optional
 
 from ..config_reader import ConfigReader
+from ..utils import FileOperations
 from ..decorators import GENERATORS, GeneratorDefinition
 
 
+# Generator modules imported for every project
+_CORE_MODULES: Final[tuple[str, ...]] = (
+    # Config file generators
+    "core.generators.configs.pyproject",
+    "core.generators.configs.readme",
+    "core.generators.configs.gitignore",
+    "core.generators.configs.env",
+    "core.generators.configs.license",
+    # Application code generators
+    "core.generators.templates.app.security",
+    "core.generators.templates.app.main",
+    "core.generators.templates.app.base",
+    "core.generators.templates.app.app",
+    "core.generators.templates.app.logger_config",
+    "core.generators.templates.app.logger_manager",
+    "core.generators.templates.app.cors",
+    "core.generators.templates.app.database",
+    "core.generators.templates.app.jwt",
+    "core.generators.templates.app.settings",
+    "core.generators.templates.app.deps",
+    # Database generators
+    "core.generators.templates.database.connection",
+    "core.generators.templates.database.dependencies",
+    # Model, schema, CRUD, service and router generators
+    "core.generators.templates.models.user",
+    "core.generators.templates.schemas.user",
+    "core.generators.templates.crud.user",
+    "core.generators.templates.services.auth",
+    "core.generators.templates.routers.auth",
+    "core.generators.templates.routers.user",
+    "core.generators.templates.routers.router_aggregator",
+    # Decorator generators
+    "core.generators.templates.decorators.rate_limit",
+)
+
+# Generator modules imported only when their gate holds. Every generator in
+# these modules must be disabled whenever its gate is False (checked by
+# tests/test_orchestrator.py), otherwise it would be silently skipped.
+_GATED_MODULES: Final[tuple[tuple[Callable[[ConfigReader], bool], tuple[str, ...]], ...]] = (
+    # Deployment config generators
+    (lambda c: c.has_docker(), (
+        "core.generators.deployment.dockerfile",
+        "core.generators.deployment.docker_compose",
+        "core.generators.deployment.dockerignore",
+    )),
+    # Database type generators
+    (lambda c: c.get_database_type() == 'MySQL', (
+        "core.generators.templates.database.mysql",
+    )),
+    (lambda c: c.get_database_type() == 'PostgreSQL', (
+        "core.generators.templates.database.postgresql",
+    )),
+    (lambda c: c.get_database_type() == 'SQLite', (
+        "core.generators.templates.database.sqlite",
+    )),
+    # Complete auth generators (refresh tokens and email verification)
+    (lambda c: c.get_auth_type() == 'complete', (
+        "core.generators.templates.app.email",
+        "core.generators.templates.models.token",
+        "core.generators.templates.schemas.token",
+        "core.generators.templates.crud.token",
+        "core.generators.templates.email.email",
+        "core.generators.templates.email.email_template",
+    )),
+    # Redis generators
+    (lambda c: c.has_redis(), (
+        "core.generators.configs.redis",
+        "core.generators.templates.app.redis",
+    )),
+    # Celery and task generators
+    (lambda c: c.has_celery(), (
+        "core.generators.configs.celery",
+        "core.generators.templates.app.celery",
+        "core.generators.templates.tasks.backup_database_task",
+        "core.generators.templates.tasks.tasks_init",
+    )),
+    # Test generators
+    (lambda c: c.has_testing(), (
+        "core.generators.templates.tests.conftest",
+        "core.generators.templates.tests.test_main",
+        "core.generators.templates.tests.test_auth",
+        "core.generators.templates.tests.test_users",
+    )),
+    # Alembic generator
+    (lambda c: c.has_migration(), (
+        "core.generators.alembic",
+    )),
+)
+
+
 class GeneratorOrchestrator:
     """Generator orchestrator - automatically discovers and manages generators using decorators"""
     
-    def __init__(self, project_path: Path, config_reader: ConfigReader):
+    def __init__(
+        self,
+        project_path: Path,
+        config_reader: ConfigReader,
+        file_ops: Optional[FileOperations] = None
+    ):
         """
         Initialize orchestrator
         
         Args:
             project_path: Project root directory path
             config_reader: Configuration reader instance
+            file_ops: File operations shared by every generator
         """
         self.project_path = Path(project_path)
         self.config_reader = config_reader
-        self.generators = []
-        self._initialize_generators()
+        self.file_ops = file_ops or FileOperations(base_path=project_path)
+    
+    @cached_property
+    def generators(self) -> List:
+        """Generator instances, built on first access"""
+        return self._initialize_generators()
     
-    def _initialize_generators(self) -> None:
+    def _initialize_generators(self) -> List:
         """Initialize generators - auto-discover, filter, and sort"""
         # 1. Import all generator modules (triggers decorator registration)
         self._import_all_generators()
@@ -37,101 +140,30 @@ class GeneratorOrchestrator:
         sorted_generators = self._resolve_dependencies(enabled_generators)
         
         # 5. Instantiate generators
-        self.generators = self._instantiate_generators(sorted_generators)
+        generators = self._instantiate_generators(sorted_generators)
         
         # 6. Log generators (for debugging)
-        self._log_generators()
+        self._log_generators(generators)
+        
+        return generators
     
     def _import_all_generators(self) -> None:
-        """Import all generator modules to trigger decorator registration"""
-        # Config file generators
-        from core.generators.configs.pyproject import PyprojectGenerator
-        from core.generators.configs.readme import ReadmeGenerator
-        from core.generators.configs.gitignore import GitignoreGenerator
-        from core.generators.configs.env import EnvGenerator
-        from core.generators.configs.license import LicenseGenerator
-        from core.generators.configs.redis import RedisConfigGenerator
-        from core.generators.configs.celery import CeleryConfigGenerator
-        
-        # Deployment config generators
-        from core.generators.deployment.dockerfile import DockerfileGenerator
-        from core.generators.deployment.docker_compose import DockerComposeGenerator
-        from core.generators.deployment.dockerignore import DockerignoreGenerator
-        
-        # Application code generators
-        from core.generators.templates.app.security import SecurityGenerator
-        from core.generators.templates.app.main import MainGenerator
-        from core.generators.templates.app.base import ConfigBaseGenerator
-        from core.generators.templates.app.app import ConfigAppGenerator
-        from core.generators.templates.app.logger_config import ConfigLoggerGenerator
-        from core.generators.templates.app.logger_manager import LoggerManagerGenerator
-        from core.generators.templates.app.cors import ConfigCorsGenerator
-        from core.generators.templates.app.database import ConfigDatabaseGenerator
-        from core.generators.templates.app.jwt import ConfigJwtGenerator
-        from core.generators.templates.app.email import ConfigEmailGenerator
-        from core.generators.templates.app.settings import ConfigSettingsGenerator
-        from core.generators.templates.app.deps import CoreDepsGenerator
-        
-        # Database generators
-        from core.generators.templates.database.connection import DatabaseConnectionGenerator
-        from core.generators.templates.database.mysql import DatabaseMySQLGenerator
-        from core.generators.templates.database.postgresql import DatabasePostgreSQLGenerator
-        from core.generators.templates.database.sqlite import SQLiteGenerator
-        from core.generators.templates.database.dependencies import DatabaseDependenciesGenerator
-        
-        # Model generators
-        from core.generators.templates.models.user import UserModelGenerator
-        from core.generators.templates.models.token import TokenModelGenerator
-        
-        # Schema generators
-        from core.generators.templates.schemas.user import UserSchemaGenerator
-        from core.generators.templates.schemas.token import TokenSchemaGenerator
-        
-        # CRUD generators
-        from core.generators.templates.crud.user import UserCRUDGenerator
-        from core.generators.templates.crud.token import TokenCRUDGenerator
-        
-        # Service generators
-        from core.generators.templates.services.auth import AuthServiceGenerator
-        
-        # Router generators
-        from core.generators.templates.routers.auth import AuthRouterGenerator
-        from core.generators.templates.routers.user import UserRouterGenerator
-        from core.generators.templates.routers.router_aggregator import RouterAggregatorGenerator
-        
-        # Decorator generators
-        from core.generators.templates.decorators.rate_limit import RateLimitDecoratorGenerator
-        
-        # Email generators
-        from core.generators.templates.email.email import EmailServiceGenerator
-        from core.generators.templates.email.email_template import EmailTemplateGenerator
-        
-        # Task generators
-        from core.generators.templates.tasks.backup_database_task import BackupDatabaseTaskGenerator
-        from core.generators.templates.tasks.tasks_init import TasksInitGenerator
-        
-        # App core generators
-        from core.generators.templates.app.celery import CeleryAppGenerator
-        from core.generators.templates.app.redis import RedisAppGenerator
-        
-        # Test generators
-        from core.generators.templates.tests.conftest import ConftestGenerator
-        from core.generators.templates.tests.test_main import TestMainGenerator
-        from core.generators.templates.tests.test_auth import TestAuthGenerator
-        from core.generators.templates.tests.test_users import TestUsersGenerator
-        
-        # Alembic generator
-        from core.generators.alembic import AlembicGenerator
+        """Import generator modules to trigger decorator registration
+        
+        Modules listed under a feature gate are only imported when that
+        feature is enabled, so unused feature modules are never loaded.
+        """
+        for module_name in _CORE_MODULES:
+            import_module(module_name)
+        
+        for gate, module_names in _GATED_MODULES:
+            if gate(self.config_reader):
+                for module_name in module_names:
+                    import_module(module_name)
     
     def _filter_enabled_generators(self) -> List[GeneratorDefinition]:
         """Filter enabled generators"""
-        enabled = []
-        
-        for name, gen_def in GENERATORS.items():
-            if self._is_enabled(gen_def):
-                enabled.append(gen_def)
-        
-        return enabled
+        return [gen_def for gen_def in GENERATORS.values() if self._is_enabled(gen_def)]
     
     def _is_enabled(self, gen_def: GeneratorDefinition) -> bool:
         """Check if generator should be enabled"""
@@ -206,25 +238,24 @@ class GeneratorOrchestrator:
     ) -> List:
         """Instantiate generators"""
         instances = []
+        # Every generator takes the same constructor arguments
+        args = (self.project_path, self.config_reader)
+        file_ops = self.file_ops
         
         for gen_def in gen_defs:
             try:
-                instance = gen_def.generator_class(
-                    self.project_path,
-                    self.config_reader
-                )
-                instances.append(instance)
+                instances.append(gen_def.generator_class(*args, file_ops=file_ops))
             except Exception as e:
                 print(f"Error: Failed to instantiate {gen_def.name}: {e}")
                 raise
         
         return instances
     
-    def _log_generators(self) -> None:
+    def _log_generators(self, generators: List) -> None:
         """Log generator information (for debugging)"""
         # print(f"Debug: Total generators registered: {len(GENERATORS)}")
-        # print(f"Debug: Enabled generators: {len(self.generators)}")
-        # for i, gen in enumerate(self.generators, 1):
+        # print(f"Debug: Enabled generators: {len(generators)}")
+        # for i, gen in enumerate(generators, 1):
         #     print(f"  {i}. {gen.__class__.__name__}")
         pass
     
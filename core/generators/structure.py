@@ -1,30 +1,35 @@
 """Project structure generation module"""
 from pathlib import Path
+from typing import Optional
 from core.utils import FileOperations
-from .alembic import AlembicGenerator
 
 
 class StructureGenerator:
     """Project structure generator - creates directory structure and initialization files"""
 
-    def __init__(self, project_path: Path, config_reader: 'ConfigReader'):
+    def __init__(
+        self,
+        project_path: Path,
+        config_reader: 'ConfigReader',
+        file_ops: Optional[FileOperations] = None
+    ):
         """Initialize structure generator
         
         Args:
             project_path: Project root directory path
             config_reader: Configuration reader instance
+            file_ops: Shared file operations; a new instance is created if omitted
         """
         self.project_path = Path(project_path)
         self.config_reader = config_reader
-        self.file_ops = FileOperations(base_path=project_path)
+        self.file_ops = file_ops or FileOperations(base_path=project_path)
 
     def create_project_structure(self) -> None:
         """Create project directory structure"""
         self._create_directories()
         self._create_init_files()
-        # Note: Project files are now generated by DynamicGeneratorOrchestrator
-        # in ProjectGenerator.generate()
-        self._init_alembic()
+        # Note: Project files (including Alembic) are generated by
+        # GeneratorOrchestrator in ProjectGenerator.generate()
     
     def _create_directories(self) -> None:
         """Create all required directories"""
@@ -42,7 +47,7 @@ class StructureGenerator:
             directories.extend(["tests", "tests/api", "tests/unit"])
         
         for directory in directories:
-            (self.project_path / directory).mkdir(parents=True, exist_ok=True)
+            self.file_ops.ensure_dir(directory)
 
     def _create_init_files(self) -> None:
         """Create all required __init__.py files"""
@@ -64,8 +69,9 @@ class StructureGenerator:
         self._create_database_init()
         
         # Batch create regular __init__.py files
-        for init_file in init_files:
-            self.file_ops.create_file(init_file, content="", overwrite=False)
+        self.file_ops.create_files_batch(
+            [(init_file, "") for init_file in init_files], overwrite=False
+        )
     
     def _create_config_init(self) -> None:
         """Create app/core/config/__init__.py"""
@@ -94,10 +100,12 @@ __all__ = ["settings"]
             imports.append("from .cors import CORSSettings")
             exports.append("CORSSettings")
         
+        imports_block = "\n".join(imports)
+        exports_block = ", ".join(f'"{exp}"' for exp in exports)
         content = f'''"""Configuration module"""
-{chr(10).join(imports)}
+{imports_block}
 
-__all__ = [{', '.join([f'"{exp}"' for exp in exports])}]
+__all__ = [{exports_block}]
 '''
         self.file_ops.create_file("app/core/config/modules/__init__.py", content, overwrite=True)
     
@@ -133,9 +141,3 @@ __all__ = ["db_manager", "{db_manager}", "Base", "get_db"]
 '''
         
         self.file_ops.create_file("app/core/database/__init__.py", content, overwrite=True)
-
-    def _init_alembic(self) -> None:
-        """Initialize Alembic migration tool"""
-        if self.config_reader.has_migration():
-            alembic_gen = AlembicGenerator(self.project_path, self.config_reader)
-            alembic_gen.generate()
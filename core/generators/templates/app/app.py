@@ -1,47 +1,54 @@
 """applicationConfiguration file generator"""
+from string import Template
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
-@Generator(
-    category="app_config",
-    priority=11,
-    requires=["ConfigBaseGenerator"],
-    description="Generate app/core/config/modules/app.py"
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from pydantic import Field",
+    "from app.core.config.base import EnvBaseSettings",
 )
-class ConfigAppGenerator(BaseTemplateGenerator):
-    """generate app/core/config/modules/app.py file"""
-    
-    def generate(self) -> None:
-        """generateapplicationconfigurationfile"""
-        project_name = self.config_reader.get_project_name()
-        
-        imports = [
-            "from pydantic import Field",
-            "from app.core.config.base import EnvBaseSettings",
-        ]
-        
-        content = f'''class AppSettings(EnvBaseSettings):
+
+
+# Compiled once at import; only the project name varies
+_APP_SETTINGS_TEMPLATE: Final[Template] = Template('''class AppSettings(EnvBaseSettings):
     """Application metadata configuration"""
     
     APP_NAME: str = Field(
-        default="{project_name}",
+        default="$project_name",
         description="Application name"
     )
     APP_DESCRIPTION: str = Field(
-        default="{project_name} is a FastAPI application.",
+        default="$project_name is a FastAPI application.",
         description="Application description",
     )
     APP_VERSION: str = Field(
         default="0.1.0",
         description="Application version"
     )
-'''
+''')
+
+
+@Generator(
+    category="app_config",
+    priority=11,
+    requires=["ConfigBaseGenerator"],
+    description="Generate app/core/config/modules/app.py"
+)
+class ConfigAppGenerator(BaseTemplateGenerator):
+    """generate app/core/config/modules/app.py file"""
+    
+    def generate(self) -> None:
+        """generateapplicationconfigurationfile"""
+        project_name = self.config_reader.get_project_name()
+        
+        content = _APP_SETTINGS_TEMPLATE.substitute(project_name=project_name)
         
         self.file_ops.create_python_file(
             file_path="app/core/config/modules/app.py",
             docstring="applicationconfigurationmodule",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,8 +1,17 @@
 """configurationbase classFile generator"""
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "import os",
+    "from pathlib import Path",
+    "from dotenv import load_dotenv",
+    "from pydantic_settings import BaseSettings, SettingsConfigDict",
+)
+
+
 @Generator(
     category="app_config",
     priority=10,
@@ -13,21 +22,17 @@ class ConfigBaseGenerator(BaseTemplateGenerator):
     
     def generate(self) -> None:
         """generateconfigurationbase classfile"""
-        imports = [
-            "import os",
-            "from pathlib import Path",
-            "from dotenv import load_dotenv",
-            "from pydantic_settings import BaseSettings",
-        ]
-        
         content = '''# Load environment variables from .env file
 ENV = os.getenv("ENV", "development")
 
-# Calculate path to project root (3 levels up from config/base.py)
-ENV_FILE = Path(__file__).resolve().parent.parent.parent.parent / f"secret/.env.{ENV}"
+# Calculate path to project root (app/core/config/base.py -> project root)
+ENV_FILE = Path(__file__).resolve().parents[3] / f"secret/.env.{ENV}"
+
+# Resolve the env file once at import time
+ENV_FILE_EXISTS = ENV_FILE.exists()
 
 # Try to load environment file if it exists, otherwise use system environment variables
-if ENV_FILE.exists():
+if ENV_FILE_EXISTS:
     load_dotenv(dotenv_path=ENV_FILE, override=True)
 else:
     import warnings
@@ -44,17 +49,18 @@ class EnvBaseSettings(BaseSettings):
     All settings should inherit from this class.
     """
     
-    class Config:
-        env_file = ENV_FILE
-        env_file_encoding = "utf-8"
-        case_sensitive = True
-        extra = "allow"  # Allow extra fields not defined in the model
+    model_config = SettingsConfigDict(
+        env_file=ENV_FILE if ENV_FILE_EXISTS else None,
+        env_file_encoding="utf-8",
+        case_sensitive=True,
+        extra="allow",  # Allow extra fields not defined in the model
+    )
 '''
         
         self.file_ops.create_python_file(
             file_path="app/core/config/base.py",
             docstring="configurationbase class - allconfigurationclassbase class",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,6 +1,5 @@
 """Celery app generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
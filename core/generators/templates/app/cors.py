@@ -1,8 +1,15 @@
 """CORS Configuration file generator"""
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from pydantic import Field",
+    "from app.core.config.base import EnvBaseSettings",
+)
+
+
 @Generator(
     category="app_config",
     priority=14,
@@ -19,11 +26,6 @@ class ConfigCorsGenerator(BaseTemplateGenerator):
         if not self.config_reader.has_cors():
             return
         
-        imports = [
-            "from pydantic import Field",
-            "from app.core.config.base import EnvBaseSettings",
-        ]
-        
         content = '''class CORSSettings(EnvBaseSettings):
     """CORS (Cross-Origin Resource Sharing) configuration"""
     
@@ -52,7 +54,7 @@ class ConfigCorsGenerator(BaseTemplateGenerator):
         self.file_ops.create_python_file(
             file_path="app/core/config/modules/cors.py",
             docstring="CORS configurationmodule",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,8 +1,21 @@
 """Core Dependencies generategenerator - generate app/core/deps.py"""
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from fastapi import Depends, HTTPException, status",
+    "from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials",
+    "from sqlalchemy.ext.asyncio import AsyncSession",
+    "",
+    "from app.core.database import get_db",
+    "from app.core.security import security_manager",
+    "from app.crud.user import user_crud",
+    "from app.models.user import User",
+)
+
+
 @Generator(
     category="app_config",
     priority=20,
@@ -18,17 +31,6 @@ class CoreDepsGenerator(BaseTemplateGenerator):
         if not self.config_reader.has_auth():
             return
         
-        imports = [
-            "from fastapi import Depends, HTTPException, status",
-            "from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials",
-            "from sqlalchemy.ext.asyncio import AsyncSession",
-            "",
-            "from app.core.database import get_db",
-            "from app.core.security import security_manager",
-            "from app.crud.user import user_crud",
-            "from app.models.user import User",
-        ]
-        
         content = '''# HTTP Bearer authenticationscheme
 security = HTTPBearer(auto_error=False)
 
@@ -117,7 +119,7 @@ async def get_current_superuser(
         self.file_ops.create_python_file(
             file_path="app/core/deps.py",
             docstring="coredependenciesinjectionfunction",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
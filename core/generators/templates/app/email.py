@@ -1,10 +1,17 @@
 """Email configurationgenerategenerator"""
 from pathlib import Path
+from typing import Final, Optional
 from core.decorators import Generator
 from core.utils import FileOperations
 from core.config_reader import ConfigReader
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from pydantic import Field, SecretStr",
+    "from pydantic_settings import BaseSettings, SettingsConfigDict",
+)
+
+
 @Generator(
     category="app_config",
     priority=17,
@@ -15,16 +22,22 @@ from core.config_reader import ConfigReader
 class ConfigEmailGenerator:
     """Email Configuration file generator"""
     
-    def __init__(self, project_path: Path, config_reader: ConfigReader):
+    def __init__(
+        self,
+        project_path: Path,
+        config_reader: ConfigReader,
+        file_ops: Optional[FileOperations] = None
+    ):
         """Initializeconfigurationgenerategenerator
         
         Args:
             project_path: Project root directory path
             config_reader: configurationReadgeneratorinstance
+            file_ops: Shared file operations; a new instance is created if omitted
         """
         self.project_path = Path(project_path)
         self.config_reader = config_reader
-        self.file_ops = FileOperations(base_path=project_path)
+        self.file_ops = file_ops or FileOperations(base_path=project_path)
     
     def generate(self) -> None:
         """generate email configurationfile"""
@@ -32,11 +45,6 @@ class ConfigEmailGenerator:
         if self.config_reader.get_auth_type() != "complete":
             return
         
-        imports = [
-            "from pydantic import Field, SecretStr",
-            "from pydantic_settings import BaseSettings",
-        ]
-        
         content = '''class EmailSettings(BaseSettings):
     """Email configuration settings"""
     
@@ -100,16 +108,17 @@ class ConfigEmailGenerator:
         description="Email sender address"
     )
     
-    class Config:
-        env_file = ".env"
-        case_sensitive = True
-        extra = "ignore"
+    model_config = SettingsConfigDict(
+        env_file=".env",
+        case_sensitive=True,
+        extra="ignore",
+    )
 '''
         
         self.file_ops.create_python_file(
             file_path="app/core/config/modules/email.py",
             docstring="Email configuration module",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
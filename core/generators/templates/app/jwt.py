@@ -1,8 +1,51 @@
 """JWT Configuration file generator"""
+from string import Template
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from typing import Optional",
+    "from pydantic import Field, PositiveInt, SecretStr",
+    "from app.core.config.base import EnvBaseSettings",
+)
+
+
+_REFRESH_TOKEN_FIELD: Final[str] = '''
+    JWT_REFRESH_TOKEN_EXPIRATION: PositiveInt = Field(
+        default=86400,
+        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
+    )'''
+
+# Compiled once at import; the refresh token field is only set for complete auth
+_JWT_SETTINGS_TEMPLATE: Final[Template] = Template('''class JWTSettings(EnvBaseSettings):
+    """JWT authenticationconfiguration"""
+
+    JWT_SECRET_KEY: SecretStr = Field(
+        ...,
+        repr=False,
+        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
+    )
+    JWT_ALGORITHM: str = Field(
+        default="HS256",
+        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
+    )
+    JWT_ACCESS_TOKEN_EXPIRATION: PositiveInt = Field(
+        default=1800,
+        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
+    )$refresh_block
+    JWT_ISSUER: Optional[str] = Field(
+        default="$project_identifier",
+        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
+    )
+    JWT_AUDIENCE: Optional[str] = Field(
+        default="${project_identifier}_users",
+        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
+    )
+''')
+
+
 @Generator(
     category="app_config",
     priority=16,
@@ -19,62 +62,23 @@ class ConfigJwtGenerator(BaseTemplateGenerator):
         if not self.config_reader.has_auth():
             return
         
-        imports = [
-            "from typing import Optional",
-            "from pydantic import Field, PositiveInt, SecretStr",
-            "from app.core.config.base import EnvBaseSettings",
-        ]
-        
         auth_type = self.config_reader.get_auth_type()
-        project_name = self.config_reader.get_project_name()
-        
-        # Generate project identifier (for issuer and audience)
-        project_identifier = project_name.lower().replace('-', '_').replace(' ', '_')
         
-        # Base JWT configuration (required for all authentication types)
-        base_fields = f'''    JWT_SECRET_KEY: SecretStr = Field(
-        ...,
-        repr=False,
-        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
-    )
-    JWT_ALGORITHM: str = Field(
-        default="HS256",
-        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
-    )
-    JWT_ACCESS_TOKEN_EXPIRATION: PositiveInt = Field(
-        default=1800,
-        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
-    )'''
+        # Project identifier (for issuer and audience)
+        project_identifier = self.config_reader.get_project_identifier()
         
         # Only Complete JWT Auth includes Refresh Token
-        if auth_type == "complete":
-            base_fields += f'''
-    JWT_REFRESH_TOKEN_EXPIRATION: PositiveInt = Field(
-        default=86400,
-        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
-    )'''
-        
-        # add issuer and audience
-        base_fields += f'''
-    JWT_ISSUER: Optional[str] = Field(
-        default="{project_identifier}",
-        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
-    )
-    JWT_AUDIENCE: Optional[str] = Field(
-        default="{project_identifier}_users",
-        description="Generate JWT configuration (app/core/config/modules/jwt.py)"
-    )'''
+        refresh_block = _REFRESH_TOKEN_FIELD if auth_type == "complete" else ""
         
-        content = f'''class JWTSettings(EnvBaseSettings):
-    """JWT authenticationconfiguration"""
-
-{base_fields}
-'''
+        content = _JWT_SETTINGS_TEMPLATE.substitute(
+            refresh_block=refresh_block,
+            project_identifier=project_identifier
+        )
         
         self.file_ops.create_python_file(
             file_path="app/core/config/modules/jwt.py",
             docstring="JWT authenticationconfigurationmodule",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,8 +1,16 @@
 """loggingConfiguration file generator - generate Pydantic configurationclass"""
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from typing import Optional",
+    "from pydantic import Field",
+    "from app.core.config.base import EnvBaseSettings",
+)
+
+
 @Generator(
     category="app_config",
     priority=12,
@@ -14,12 +22,6 @@ class ConfigLoggerGenerator(BaseTemplateGenerator):
     
     def generate(self) -> None:
         """generateloggingconfigurationfile"""
-        imports = [
-            "from typing import Optional",
-            "from pydantic import Field",
-            "from app.core.config.base import EnvBaseSettings",
-        ]
-        
         content = '''class LoggingSettings(EnvBaseSettings):
     """Loguru loggingconfigurationSet"""
     
@@ -56,7 +58,7 @@ class ConfigLoggerGenerator(BaseTemplateGenerator):
         self.file_ops.create_python_file(
             file_path="app/core/config/modules/logger.py",
             docstring="loggingconfigurationmodule",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
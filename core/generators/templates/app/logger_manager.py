@@ -1,8 +1,21 @@
 """Logger Manager generategenerator"""
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "import sys",
+    "import logging",
+    "from functools import lru_cache",
+    "from pathlib import Path",
+    "from typing import Optional",
+    "from loguru import logger",
+    "",
+    "from app.core.config.settings import settings",
+)
+
+
 @Generator(
     category="app_config",
     priority=13,
@@ -14,25 +27,44 @@ class LoggerManagerGenerator(BaseTemplateGenerator):
     
     def generate(self) -> None:
         """generate Logger Manager file"""
-        imports = [
-            "import sys",
-            "import logging",
-            "from pathlib import Path",
-            "from typing import Optional",
-            "from loguru import logger",
-            "",
-            "from app.core.config.settings import settings",
-        ]
+        content = '''
+@lru_cache(maxsize=256)
+def _get_bound_logger(name: str):
+    """Bind a named logger once and reuse it"""
+    return logger.bind(name=name)
+
+
+class InterceptHandler(logging.Handler):
+    """Redirect standard library log records to Loguru"""
+    
+    def emit(self, record: logging.LogRecord) -> None:
+        # Get corresponding Loguru level
+        try:
+            level = logger.level(record.levelname).name
+        except ValueError:
+            level = record.levelno
+        
+        # Find caller
+        frame, depth = logging.currentframe(), 2
+        while frame.f_code.co_filename == logging.__file__:
+            frame = frame.f_back
+            depth += 1
         
-        content = '''class LoggerManager:
+        logger.opt(depth=depth, exception=record.exc_info).log(
+            level, record.getMessage()
+        )
+
+
+class LoggerManager:
     """Logging management generator
     
     Use Loguru as logging library, provides unified logging management interface
     """
     
+    __slots__ = ("_initialized",)
+    
     def __init__(self):
         self._initialized = False
-        self._loggers = {}
     
     def setup(self) -> None:
         """Initializeloggingconfiguration"""
@@ -42,8 +74,12 @@ class LoggerManagerGenerator(BaseTemplateGenerator):
         # removedefault handler
         logger.remove()
         
+        # Levels of the added sinks, used to pre-filter standard library records
+        sink_levels = []
+        
         # Console output
         if settings.logging.LOG_TO_CONSOLE:
+            sink_levels.append(settings.logging.LOG_CONSOLE_LEVEL)
             logger.add(
                 sys.stdout,
                 level=settings.logging.LOG_CONSOLE_LEVEL,
@@ -59,6 +95,7 @@ class LoggerManagerGenerator(BaseTemplateGenerator):
             log_path = Path(settings.logging.LOG_FILE_PATH)
             log_path.parent.mkdir(parents=True, exist_ok=True)
             
+            sink_levels.append(settings.logging.LOG_LEVEL)
             logger.add(
                 settings.logging.LOG_FILE_PATH,
                 level=settings.logging.LOG_LEVEL,
@@ -70,38 +107,28 @@ class LoggerManagerGenerator(BaseTemplateGenerator):
             )
         
         # Intercept standard library logging
-        self._intercept_standard_logging()
+        self._intercept_standard_logging(sink_levels)
         
         self._initialized = True
         logger.info("Logger initialized successfully")
     
-    def _intercept_standard_logging(self) -> None:
-        """Intercept standard library logging, redirect to Loguru"""
+    def _intercept_standard_logging(self, sink_levels: list) -> None:
+        """Intercept standard library logging, redirect to Loguru
         
-        class InterceptHandler(logging.Handler):
-            def emit(self, record: logging.LogRecord) -> None:
-                # Get corresponding Loguru level
-                try:
-                    level = logger.level(record.levelname).name
-                except ValueError:
-                    level = record.levelno
-                
-                # Find caller
-                frame, depth = logging.currentframe(), 2
-                while frame.f_code.co_filename == logging.__file__:
-                    frame = frame.f_back
-                    depth += 1
-                
-                logger.opt(depth=depth, exception=record.exc_info).log(
-                    level, record.getMessage()
-                )
+        Args:
+            sink_levels: Level names of the Loguru sinks
+        """
+        # Records below every sink's level are dropped before emit() runs,
+        # including those from the library loggers re-pointed below
+        min_level = min((logger.level(level).no for level in sink_levels), default=0)
+        handler = InterceptHandler(level=min_level)
         
         # Intercept standard library logging
-        logging.basicConfig(handlers=[InterceptHandler()], level=0, force=True)
+        logging.basicConfig(handlers=[handler], level=min_level, force=True)
         
         # Intercept common library logging
         for logger_name in ["uvicorn", "uvicorn.access", "uvicorn.error", "fastapi"]:
-            logging.getLogger(logger_name).handlers = [InterceptHandler()]
+            logging.getLogger(logger_name).handlers = [handler]
     
     def get_logger(self, name: Optional[str] = None):
         """Get logger instance
@@ -116,7 +143,7 @@ class LoggerManagerGenerator(BaseTemplateGenerator):
             self.setup()
         
         if name:
-            return logger.bind(name=name)
+            return _get_bound_logger(name)
         return logger
 
 
@@ -127,7 +154,7 @@ logger_manager = LoggerManager()
         self.file_ops.create_python_file(
             file_path="app/core/logger.py",
             docstring="Logger managementgeneratormodule",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,9 +1,19 @@
 """Redis app generator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from redis.asyncio import Redis as AsyncRedis",
+    "from redis.asyncio import from_url as async_from_url",
+    "from redis import Redis as SyncRedis",
+    "from redis import from_url as sync_from_url",
+    "from app.core.config.settings import settings",
+    "from app.core.logger import logger_manager",
+)
+
+
 @Generator(
     category="app",
     priority=48,
@@ -17,15 +27,6 @@ class RedisAppGenerator(BaseTemplateGenerator):
     def generate(self) -> None:
         """Generate Redis connection manager file"""
         
-        imports = [
-            "from redis.asyncio import Redis as AsyncRedis",
-            "from redis.asyncio import from_url as async_from_url",
-            "from redis import Redis as SyncRedis",
-            "from redis import from_url as sync_from_url",
-            "from app.core.config.settings import settings",
-            "from app.core.logger import logger_manager",
-        ]
-        
         content = '''class RedisManager:
     """Redis connection manager - supports async and sync clients"""
     
@@ -183,7 +184,7 @@ redis_manager = RedisManager()
         self.file_ops.create_python_file(
             file_path="app/core/redis.py",
             docstring="Redis connection manager - supports async and sync clients",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
\ No newline at end of file
@@ -1,9 +1,21 @@
 """Security management file generator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from .base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "import re",
+    "from datetime import datetime, timedelta, timezone",
+    "from typing import Dict, Optional, Union",
+    "from jose import jwt",
+    "from jose.exceptions import JWTError, ExpiredSignatureError",
+    "import argon2",
+    "from app.core.logger import logger_manager",
+    "from app.core.config.settings import settings",
+)
+
+
 @Generator(
     category="app_config",
     priority=19,
@@ -21,23 +33,12 @@ class SecurityGenerator(BaseTemplateGenerator):
         auth_type = self.config_reader.get_auth_type()
         has_refresh_token = self.config_reader.has_refresh_token()
         
-        imports = [
-            "import re",
-            "from datetime import datetime, timedelta, timezone",
-            "from typing import Dict, Optional, Union",
-            "from jose import jwt",
-            "from jose.exceptions import JWTError, ExpiredSignatureError",
-            "import argon2",
-            "from app.core.logger import logger_manager",
-            "from app.core.config.settings import settings",
-        ]
-        
         content = self._generate_security_content(has_refresh_token)
         
         self.file_ops.create_python_file(
             file_path="app/core/security.py",
             docstring="Security management module - Password validation, hashing and JWT management",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,8 +1,139 @@
 """Settings Configuration file generator"""
+from functools import lru_cache
+from typing import Final, NamedTuple, Tuple
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+class ConfigModule(NamedTuple):
+    """A settings section exposed on the generated Settings class"""
+    import_stmt: str
+    prop: str
+    cls: str
+
+
+# One lazily built settings section on the generated Settings class
+_PROPERTY_TEMPLATE: Final[str] = '''    @cached_property
+    def {prop}(self) -> {cls}:
+        return {cls}()'''
+
+# Fixed scaffold around the generated properties
+_SETTINGS_PREFIX: Final[str] = '''class Settings:
+    """Global configuration class
+    
+    Use cached_property for lazy loading configuration, improves performance
+    """
+
+'''
+
+_SETTINGS_SUFFIX: Final[str] = '''
+
+
+# Create a global settings instance
+settings = Settings()
+'''
+
+
+@lru_cache(maxsize=8)
+def _build_settings_source(
+    has_auth: bool,
+    auth_type: str,
+    has_cors: bool,
+    has_redis: bool,
+    has_celery: bool
+) -> Tuple[tuple, str]:
+    """Build settings.py imports and content for a feature combination
+    
+    Args:
+        has_auth: Whether authentication is enabled
+        auth_type: Authentication type
+        has_cors: Whether CORS is enabled
+        has_redis: Whether Redis is enabled
+        has_celery: Whether Celery is enabled
+    
+    Returns:
+        Import statements and file content
+    """
+    imports = ["from functools import cached_property"]
+    
+    # Collect all required configuration modules
+    config_modules = []
+    
+    # Base configuration (always included)
+    config_modules.append(ConfigModule(
+        "from app.core.config.modules.app import AppSettings",
+        "app",
+        "AppSettings",
+    ))
+    
+    config_modules.append(ConfigModule(
+        "from app.core.config.modules.logger import LoggingSettings",
+        "logging",
+        "LoggingSettings",
+    ))
+    
+    # databaseconfiguration(is nowrequired)
+    config_modules.append(ConfigModule(
+        "from app.core.config.modules.database import DatabaseSettings",
+        "database",
+        "DatabaseSettings",
+    ))
+    
+    # JWT configuration(ifenableauthentication)
+    if has_auth:
+        config_modules.append(ConfigModule(
+            "from app.core.config.modules.jwt import JWTSettings",
+            "jwt",
+            "JWTSettings",
+        ))
+    
+    # Email configuration(ifyes Complete JWT Auth)
+    if auth_type == "complete":
+        config_modules.append(ConfigModule(
+            "from app.core.config.modules.email import EmailSettings",
+            "email",
+            "EmailSettings",
+        ))
+    
+    # CORS configuration(ifenable)
+    if has_cors:
+        config_modules.append(ConfigModule(
+            "from app.core.config.modules.cors import CORSSettings",
+            "cors",
+            "CORSSettings",
+        ))
+    
+    # Redis configuration (if enabled)
+    if has_redis:
+        config_modules.append(ConfigModule(
+            "from app.core.config.modules.redis import RedisSettings",
+            "redis",
+            "RedisSettings",
+        ))
+    
+    # Celery configuration (if enabled)
+    if has_celery:
+        config_modules.append(ConfigModule(
+            "from app.core.config.modules.celery import CelerySettings",
+            "celery",
+            "CelerySettings",
+        ))
+    
+    # Build import statements
+    imports.extend(module.import_stmt for module in config_modules)
+    
+    # Build Settings classattribute
+    properties = [
+        _PROPERTY_TEMPLATE.format(prop=module.prop, cls=module.cls)
+        for module in config_modules
+    ]
+    
+    # BuildcompleteContent
+    content = _SETTINGS_PREFIX + "\n".join(properties) + _SETTINGS_SUFFIX
+    
+    return tuple(imports), content
+
+
 @Generator(
     category="app_config",
     priority=18,
@@ -14,96 +145,13 @@ class ConfigSettingsGenerator(BaseTemplateGenerator):
     
     def generate(self) -> None:
         """generate Settings configurationfile"""
-        imports = ["from functools import cached_property"]
-        
-        # Collect all required configuration modules
-        config_modules = []
-        
-        # Base configuration (always included)
-        config_modules.append({
-            "import": "from app.core.config.modules.app import AppSettings",
-            "property": "app",
-            "class": "AppSettings"
-        })
-        
-        config_modules.append({
-            "import": "from app.core.config.modules.logger import LoggingSettings",
-            "property": "logging",
-            "class": "LoggingSettings"
-        })
-        
-        # databaseconfiguration(is nowrequired)
-        config_modules.append({
-            "import": "from app.core.config.modules.database import DatabaseSettings",
-            "property": "database",
-            "class": "DatabaseSettings"
-        })
-        
-        # JWT configuration(ifenableauthentication)
-        if self.config_reader.has_auth():
-            config_modules.append({
-                "import": "from app.core.config.modules.jwt import JWTSettings",
-                "property": "jwt",
-                "class": "JWTSettings"
-            })
-        
-        # Email configuration(ifyes Complete JWT Auth)
-        if self.config_reader.get_auth_type() == "complete":
-            config_modules.append({
-                "import": "from app.core.config.modules.email import EmailSettings",
-                "property": "email",
-                "class": "EmailSettings"
-            })
-        
-        # CORS configuration(ifenable)
-        if self.config_reader.has_cors():
-            config_modules.append({
-                "import": "from app.core.config.modules.cors import CORSSettings",
-                "property": "cors",
-                "class": "CORSSettings"
-            })
-        
-        # Redis configuration (if enabled)
-        if self.config_reader.has_redis():
-            config_modules.append({
-                "import": "from app.core.config.modules.redis import RedisSettings",
-                "property": "redis",
-                "class": "RedisSettings"
-            })
-        
-        # Celery configuration (if enabled)
-        if self.config_reader.has_celery():
-            config_modules.append({
-                "import": "from app.core.config.modules.celery import CelerySettings",
-                "property": "celery",
-                "class": "CelerySettings"
-            })
-        
-        # Build import statements
-        for module in config_modules:
-            imports.append(module["import"])
-        
-        # Build Settings classattribute
-        properties = []
-        for module in config_modules:
-            property_code = f'''    @cached_property
-    def {module["property"]}(self) -> {module["class"]}:
-        return {module["class"]}()'''
-            properties.append(property_code)
-        
-        # BuildcompleteContent
-        content = f'''class Settings:
-    """Global configuration class
-    
-    Use cached_property for lazy loading configuration, improves performance
-    """
-
-{chr(10).join(properties)}
-
-
-# Create a global settings instance
-settings = Settings()
-'''
+        imports, content = _build_settings_source(
+            self.config_reader.has_auth(),
+            self.config_reader.get_auth_type(),
+            self.config_reader.has_cors(),
+            self.config_reader.has_redis(),
+            self.config_reader.has_celery(),
+        )
         
         self.file_ops.create_python_file(
             file_path="app/core/config/settings.py",
@@ -1,6 +1,5 @@
 """user CRUD generategenerator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
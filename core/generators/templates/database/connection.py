@@ -1,6 +1,5 @@
 """database connectionFile generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
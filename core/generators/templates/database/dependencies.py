@@ -1,6 +1,5 @@
 """database dependency injectionFile generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
@@ -1,9 +1,19 @@
 """MySQL database managementgeneratorgenerategenerator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from collections.abc import AsyncGenerator",
+    "from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession",
+    "from sqlalchemy import create_engine, text",
+    "from sqlalchemy.orm import sessionmaker, Session, declarative_base",
+    "from app.core.logger import logger_manager",
+    "from app.core.config.settings import settings",
+)
+
+
 @Generator(
     category="database",
     priority=31,
@@ -22,15 +32,6 @@ class DatabaseMySQLGenerator(BaseTemplateGenerator):
         
         orm_type = self.config_reader.get_orm_type()
         
-        imports = [
-            "from collections.abc import AsyncGenerator",
-            "from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession",
-            "from sqlalchemy import create_engine, text",
-            "from sqlalchemy.orm import sessionmaker, Session, declarative_base",
-            "from app.core.logger import logger_manager",
-            "from app.core.config.settings import settings",
-        ]
-        
         # add Base definition
         base_definition = '''# SQLAlchemy declarativebase class
 Base = declarative_base()
@@ -187,7 +188,7 @@ mysql_manager = MySQLManager()
         self.file_ops.create_python_file(
             file_path="app/core/database/mysql.py",
             docstring="MySQL database connection managementgenerator",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,9 +1,19 @@
 """PostgreSQL database managementgeneratorgenerategenerator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from collections.abc import AsyncGenerator",
+    "from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession",
+    "from sqlalchemy import create_engine, text",
+    "from sqlalchemy.orm import sessionmaker, Session, declarative_base",
+    "from app.core.logger import logger_manager",
+    "from app.core.config.settings import settings",
+)
+
+
 @Generator(
     category="database",
     priority=31,
@@ -22,15 +32,6 @@ class DatabasePostgreSQLGenerator(BaseTemplateGenerator):
         
         orm_type = self.config_reader.get_orm_type()
         
-        imports = [
-            "from collections.abc import AsyncGenerator",
-            "from sqlalchemy.ext.asyncio import create_async_engine, async_sessionmaker, AsyncSession",
-            "from sqlalchemy import create_engine, text",
-            "from sqlalchemy.orm import sessionmaker, Session, declarative_base",
-            "from app.core.logger import logger_manager",
-            "from app.core.config.settings import settings",
-        ]
-        
         # add Base definition
         base_definition = '''# SQLAlchemy declarativebase class
 Base = declarative_base()
@@ -180,7 +181,7 @@ postgresql_manager = PostgreSQLManager()
         self.file_ops.create_python_file(
             file_path="app/core/database/postgresql.py",
             docstring="PostgreSQL database connection managementgenerator",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -6,6 +6,7 @@ from ..base import BaseTemplateGenerator
 @Generator(
     category="database",
     priority=35,
+    enabled_when=lambda c: c.get_database_type() == 'SQLite',
     description="Generate SQLite database configuration"
 )
 class SQLiteGenerator(BaseTemplateGenerator):
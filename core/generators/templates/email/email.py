@@ -1,8 +1,29 @@
 """Email servicegenerategenerator"""
+from typing import Final
 from core.decorators import Generator
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "import asyncio",
+    "import smtplib",
+    "import ssl",
+    "from abc import ABC, abstractmethod",
+    "from asyncio import TimeoutError as AsyncioTimeoutError",
+    "from datetime import datetime",
+    "from email.mime.multipart import MIMEMultipart",
+    "from email.mime.text import MIMEText",
+    "from pathlib import Path",
+    "from typing import Dict, List, Optional, Union, Any",
+    "",
+    "from fastapi import HTTPException",
+    "from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape",
+    "",
+    "from app.core.config.settings import settings",
+    "from app.core.logger import logger_manager",
+)
+
+
 @Generator(
     category="email",
     priority=75,
@@ -19,25 +40,6 @@ class EmailServiceGenerator(BaseTemplateGenerator):
         if self.config_reader.get_auth_type() != "complete":
             return
         
-        imports = [
-            "import asyncio",
-            "import smtplib",
-            "import ssl",
-            "from abc import ABC, abstractmethod",
-            "from asyncio import TimeoutError as AsyncioTimeoutError",
-            "from datetime import datetime",
-            "from email.mime.multipart import MIMEMultipart",
-            "from email.mime.text import MIMEText",
-            "from pathlib import Path",
-            "from typing import Dict, List, Optional, Union, Any",
-            "",
-            "from fastapi import HTTPException",
-            "from jinja2 import Environment, FileSystemLoader, TemplateNotFound, select_autoescape",
-            "",
-            "from app.core.config.settings import settings",
-            "from app.core.logger import logger_manager",
-        ]
-        
         content = '''class EmailBackend(ABC):
     """Abstract base class for email backends."""
     
@@ -546,7 +548,7 @@ email_service = EmailServiceProxy()
         self.file_ops.create_python_file(
             file_path="app/utils/email.py",
             docstring="Email service for sending emails with template support",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
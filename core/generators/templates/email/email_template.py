@@ -1,6 +1,5 @@
 """Email templategenerategenerator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
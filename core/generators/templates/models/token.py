@@ -1,6 +1,5 @@
 """Token model generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
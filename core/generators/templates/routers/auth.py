@@ -1,6 +1,5 @@
 """authentication routesgenerategenerator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
@@ -1,9 +1,15 @@
 """Router aggregator generator - generates app/routers/v1/__init__.py"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from .auth import router as auth_router",
+    "from .users import router as user_router",
+)
+
+
 @Generator(
     category="router",
     priority=82,
@@ -24,11 +30,6 @@ class RouterAggregatorGenerator(BaseTemplateGenerator):
     
     def _generate_router_aggregator(self) -> None:
         """Generate app/routers/v1/__init__.py"""
-        imports = [
-            "from .auth import router as auth_router",
-            "from .users import router as user_router",
-        ]
-        
         exports = ["auth_router", "user_router"]
         
         content = f'''# Export all routers
@@ -38,7 +39,7 @@ __all__ = {exports}
         self.file_ops.create_python_file(
             file_path="app/routers/v1/__init__.py",
             docstring="API v1 router module - aggregates all v1 routers",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
@@ -1,9 +1,22 @@
 """user routesgenerategenerator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from fastapi import APIRouter, Depends, HTTPException, status",
+    "from sqlalchemy.ext.asyncio import AsyncSession",
+    "from typing import List",
+    "",
+    "from app.core.database import get_db",
+    "from app.core.deps import get_current_user, get_current_superuser",
+    "from app.models.user import User",
+    "from app.schemas.user import UserResponse, UserUpdate",
+    "from app.crud.user import user_crud",
+)
+
+
 @Generator(
     category="router",
     priority=81,
@@ -24,18 +37,6 @@ class UserRouterGenerator(BaseTemplateGenerator):
     
     def _generate_user_router(self) -> None:
         """generateuser routes"""
-        imports = [
-            "from fastapi import APIRouter, Depends, HTTPException, status",
-            "from sqlalchemy.ext.asyncio import AsyncSession",
-            "from typing import List",
-            "",
-            "from app.core.database import get_db",
-            "from app.core.deps import get_current_user, get_current_superuser",
-            "from app.models.user import User",
-            "from app.schemas.user import UserResponse, UserUpdate",
-            "from app.crud.user import user_crud",
-        ]
-        
         content = '''router = APIRouter(prefix="/users", tags=["Users"])
 
 
@@ -246,7 +247,7 @@ async def delete_user(
         self.file_ops.create_python_file(
             file_path="app/routers/v1/users.py",
             docstring="usermanagementrouter",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
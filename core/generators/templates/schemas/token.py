@@ -1,9 +1,16 @@
 """Token Schema generategenerator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from datetime import datetime",
+    "from typing import Optional",
+    "from pydantic import BaseModel, Field, ConfigDict",
+)
+
+
 @Generator(
     category="schema",
     priority=51,
@@ -23,12 +30,6 @@ class TokenSchemaGenerator(BaseTemplateGenerator):
     
     def _generate_token_schemas(self) -> None:
         """generate Token Schemas"""
-        imports = [
-            "from datetime import datetime",
-            "from typing import Optional",
-            "from pydantic import BaseModel, Field, ConfigDict",
-        ]
-        
         content = '''# ========== Refresh Token Schemas ==========
 
 class RefreshTokenBase(BaseModel):
@@ -123,7 +124,7 @@ class VerificationCodeVerify(BaseModel):
         self.file_ops.create_python_file(
             file_path="app/schemas/token.py",
             docstring="Token related Pydantic Schemas - Complete JWT Auth",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
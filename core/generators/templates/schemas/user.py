@@ -1,6 +1,5 @@
 """user Schema generategenerator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
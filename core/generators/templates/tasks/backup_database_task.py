@@ -1,9 +1,24 @@
 """Database backup task generator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "import gzip",
+    "import os", 
+    "import subprocess",
+    "from datetime import datetime, timedelta",
+    "from pathlib import Path",
+    "from urllib.parse import urlparse",
+    "from typing import Optional, List",
+    "",
+    "from app.core.celery import celery_app, with_db_init",
+    "from app.core.config.settings import settings",
+    "from app.core.logger import logger_manager",
+)
+
+
 @Generator(
     category="task",
     priority=60,
@@ -17,20 +32,6 @@ class BackupDatabaseTaskGenerator(BaseTemplateGenerator):
         """Generate database backup task file"""
         project_name = self.config_reader.get_project_name()
         
-        imports = [
-            "import gzip",
-            "import os", 
-            "import subprocess",
-            "from datetime import datetime, timedelta",
-            "from pathlib import Path",
-            "from urllib.parse import urlparse",
-            "from typing import Optional, List",
-            "",
-            "from app.core.celery import celery_app, with_db_init",
-            "from app.core.config.settings import settings",
-            "from app.core.logger import logger_manager",
-        ]
-        
         content = f'''logger = logger_manager.get_logger(__name__)
 
 
@@ -466,7 +467,7 @@ def backup_database_task(
         self.file_ops.create_python_file(
             file_path="app/tasks/backup_database_task.py",
             docstring="Database backup task - backup to local storage",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
\ No newline at end of file
@@ -1,9 +1,14 @@
 """Tasks __init__.py generator"""
+from typing import Final
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
+_IMPORTS: Final[tuple[str, ...]] = (
+    "from .backup_database_task import backup_database_task",
+)
+
+
 @Generator(
     category="task",
     priority=59,
@@ -16,10 +21,6 @@ class TasksInitGenerator(BaseTemplateGenerator):
     def generate(self) -> None:
         """Generate tasks __init__.py file"""
         
-        imports = [
-            "from .backup_database_task import backup_database_task",
-        ]
-        
         content = '''# Export all tasks
 __all__ = [
     "backup_database_task"
@@ -29,7 +30,7 @@ __all__ = [
         self.file_ops.create_python_file(
             file_path="app/tasks/__init__.py",
             docstring="Celery tasks module\n\nThis module contains all Celery async task definitions.\n\nUsage:\n    from app.tasks.backup_database_task import backup_database_task\n    \n    # Execute task asynchronously\n    result = backup_database_task.delay()\n    \n    # Get task result\n    task_result = result.get()",
-            imports=imports,
+            imports=_IMPORTS,
             content=content,
             overwrite=True
         )
\ No newline at end of file
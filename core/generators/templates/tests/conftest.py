@@ -1,6 +1,5 @@
 """Pytest configuration generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
@@ -38,9 +37,10 @@ class ConftestGenerator(BaseTemplateGenerator):
             "from app.core.config import settings",
             "from app.core.database import Base, get_db",
         ]
+        imports_block = "\n".join(imports)
         
         content = f'''"""Pytest configuration and fixtures"""
-{chr(10).join(imports)}
+{imports_block}
 
 
 # Use SQLite for testing (file-based for reliability with async)
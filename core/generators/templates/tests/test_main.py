@@ -1,6 +1,5 @@
 """Test main API endpoints generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
@@ -1,6 +1,5 @@
 """Test user endpoints generator"""
 from core.decorators import Generator
-from pathlib import Path
 from ..base import BaseTemplateGenerator
 
 
@@ -1,6 +1,7 @@
 """Project generator module"""
 from pathlib import Path
 from core.config_reader import ConfigReader
+from core.utils import FileOperations
 from .generators.structure import StructureGenerator
 from .generators.orchestrator import GeneratorOrchestrator
 
@@ -16,7 +17,9 @@ class ProjectGenerator:
         """
         self.project_path = Path(project_path)
         self.config_reader = ConfigReader(project_path)
-        self.structure_generator = StructureGenerator(project_path, self.config_reader)
+        # One FileOperations for the whole run, so its directory cache is shared
+        self.file_ops = FileOperations(base_path=project_path)
+        self.structure_generator = StructureGenerator(project_path, self.config_reader, self.file_ops)
         self.orchestrator = None  # Delay initialization until config is loaded
 
     def generate(self) -> None:
@@ -25,7 +28,7 @@ class ProjectGenerator:
         self.structure_generator.create_project_structure()
         
         # 2. Initialize orchestrator after config is loaded
-        self.orchestrator = GeneratorOrchestrator(self.project_path, self.config_reader)
+        self.orchestrator = GeneratorOrchestrator(self.project_path, self.config_reader, self.file_ops)
         
         # 3. Generate all files using orchestrator
         self.orchestrator.generate()
@@ -1,6 +1,35 @@
 """File generation utility class"""
+import os
 from pathlib import Path
-from typing import Optional, List, Union
+from typing import Iterable, Optional, List, Sequence, Tuple, Union
+
+
+def write_file_bytes(path: Union[str, Path], data: bytes, exclusive: bool = False) -> None:
+    """
+    Write bytes to a file with unbuffered os-level writes
+
+    Skips the text/buffered IO layers; small generated files go out in a
+    single write call.
+
+    Args:
+        path: File path
+        data: Encoded file content
+        exclusive: Fail instead of truncating when the file already exists
+
+    Raises:
+        FileExistsError: File already exists and exclusive=True
+    """
+    # O_BINARY keeps Windows from translating "\n" to "\r\n" on write
+    flags = os.O_WRONLY | os.O_CREAT | getattr(os, "O_BINARY", 0)
+    flags |= os.O_EXCL if exclusive else os.O_TRUNC
+    fd = os.open(path, flags, 0o666)
+    try:
+        view = memoryview(data)
+        while view:
+            written = os.write(fd, view)
+            view = view[written:]
+    finally:
+        os.close(fd)
 
 
 class FileOperations:
@@ -14,6 +43,8 @@ class FileOperations:
             base_path: Base path, all relative paths are based on this path
         """
         self.base_path = Path(base_path) if base_path else Path.cwd()
+        # Directories already ensured by this instance, to skip repeat mkdir calls
+        self._created_dirs: set[Path] = set()
 
     def create_file(
         self,
@@ -34,21 +65,87 @@ class FileOperations:
         Returns:
             CreateFile path
 
+        Raises:
+            FileExistsError: File already existsandoverwrite=False
+        """
+        return self.create_file_bytes(file_path, content.encode(encoding), overwrite=overwrite)
+
+    def create_file_bytes(
+        self,
+        file_path: Union[str, Path],
+        data: bytes,
+        overwrite: bool = False
+    ) -> Path:
+        """
+        Create file from already-encoded content
+
+        Args:
+            file_path: File path(relative tobase_pathor absolute path)
+            data: Encoded file content
+            overwrite: Whether to overwrite existing files
+
+        Returns:
+            CreateFile path
+
         Raises:
             FileExistsError: File already existsandoverwrite=False
         """
         full_path = self._resolve_path(file_path)
 
-        if full_path.exists() and not overwrite:
-            raise FileExistsError(f"File already exists: {full_path}")
+        if full_path.exists():
+            if not overwrite:
+                raise FileExistsError(f"File already exists: {full_path}")
+            # Leave byte-identical files untouched on re-runs
+            if full_path.read_bytes() == data:
+                return full_path
 
         # Ensure parent directory exists
-        full_path.parent.mkdir(parents=True, exist_ok=True)
+        self.ensure_dir(full_path.parent)
 
         # Write file
-        full_path.write_text(content, encoding=encoding)
+        write_file_bytes(full_path, data)
         return full_path
 
+    def create_files_batch(
+        self,
+        files: Iterable[Tuple[Union[str, Path], str]],
+        encoding: str = "utf-8",
+        overwrite: bool = False
+    ) -> List[Path]:
+        """
+        Create several files in one pass
+
+        Parent directories are ensured once up front. Without overwrite each
+        file is opened exclusively, so the existence check and the create
+        share one open call.
+
+        Args:
+            files: (file path, content) pairs
+            encoding: File encoding
+            overwrite: Whether to overwrite existing files
+
+        Returns:
+            Created file paths
+
+        Raises:
+            FileExistsError: File already existsandoverwrite=False
+        """
+        resolved = [
+            (self._resolve_path(file_path), content.encode(encoding))
+            for file_path, content in files
+        ]
+
+        for directory in sorted({path.parent for path, _ in resolved}, key=lambda d: len(d.parts)):
+            self.ensure_dir(directory)
+
+        for path, data in resolved:
+            if overwrite:
+                self.create_file_bytes(path, data, overwrite=True)
+            else:
+                write_file_bytes(path, data, exclusive=True)
+
+        return [path for path, _ in resolved]
+
     def append_content(
         self,
         file_path: Union[str, Path],
@@ -262,7 +359,7 @@ class FileOperations:
         self,
         file_path: Union[str, Path],
         docstring: Optional[str] = None,
-        imports: Optional[List[str]] = None,
+        imports: Optional[Sequence[str]] = None,
         content: str = "",
         overwrite: bool = False
     ) -> Path:
@@ -272,7 +369,7 @@ class FileOperations:
         Args:
             file_path: File path
             docstring: File docstring
-            imports: List of import statements
+            imports: Import statements
             content: File content
             overwrite: Whether to overwrite existing files
 
@@ -370,6 +467,24 @@ class FileOperations:
         full_content = '\n\n'.join(parts) + '\n'
         return self.create_file(file_path, full_content, overwrite=overwrite)
 
+    def ensure_dir(self, directory: Union[str, Path]) -> Path:
+        """
+        Create directory (and parents) once per instance
+
+        Args:
+            directory: Directory path(relative tobase_pathor absolute path)
+
+        Returns:
+            Directory path
+        """
+        full_path = self._resolve_path(directory)
+        if full_path not in self._created_dirs:
+            full_path.mkdir(parents=True, exist_ok=True)
+            # mkdir(parents=True) also guarantees every ancestor exists
+            self._created_dirs.add(full_path)
+            self._created_dirs.update(full_path.parents)
+        return full_path
+
     def _resolve_path(self, file_path: Union[str, Path]) -> Path:
         """
         parseFile path
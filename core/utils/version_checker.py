@@ -1,27 +1,164 @@
 """Version checker utility"""
+import atexit
 import json
+import os
+import tempfile
+import threading
+import time
 import urllib.request
 import urllib.error
 import subprocess
 import sys
+from pathlib import Path
 from typing import Optional, Tuple
 from packaging import version
 from core.version import __version__
 from ui.colors import get_colors, console
-import questionary
+
+# PyPI JSON API endpoint; the User-Agent identifies Forge and how to reach its maintainer
+PYPI_URL = "https://pypi.org/pypi/ningfastforge/json"
+USER_AGENT = f"Forge-CLI/{__version__} (+https://github.com/ning3739/forge; ln729500172@gmail.com)"
+_REQUEST_HEADERS = {"User-Agent": USER_AGENT, "Accept": "application/json"}
+
+# On-disk cache of the latest PyPI version, shared across CLI invocations
+_CACHE_PATH = Path(tempfile.gettempdir()) / "forge_pypi_version.json"
+_TTL = 86400
+_RATE_LIMIT_STATUSES = (429, 503)
+_REQUEST_TIMEOUT = 3
+
+# Background prefetch state
+_PREFETCH_DEADLINE = 0.3
+_prefetch_done = threading.Event()
+_prefetch_result: dict = {}
+_prefetch_thread: Optional[threading.Thread] = None
+
+
+def _is_number(value) -> bool:
+    """Return True for int or float values (bool excluded)"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def _read_cache() -> Optional[dict]:
+    """Read cached version entry, or None if missing or unreadable"""
+    try:
+        entry = json.loads(_CACHE_PATH.read_bytes())
+    except (OSError, ValueError):
+        return None
+    if not isinstance(entry, dict) or "value" not in entry:
+        return None
+    if not _is_number(entry.get("ts")) or not _is_number(entry.get("ttl", _TTL)):
+        return None
+    return entry
+
+
+def _write_cache(value: Optional[str], ttl: int = _TTL) -> None:
+    """Atomically write the cached version entry"""
+    entry = {"ts": time.time(), "value": value, "ttl": ttl}
+    try:
+        fd, tmp_path = tempfile.mkstemp(dir=_CACHE_PATH.parent, prefix="forge_pypi_", suffix=".tmp")
+    except OSError:
+        return
+    try:
+        with os.fdopen(fd, "w", encoding="utf-8") as f:
+            f.write(json.dumps(entry))
+        os.replace(tmp_path, _CACHE_PATH)
+    except OSError:
+        try:
+            os.unlink(tmp_path)
+        except OSError:
+            pass
+
+
+def _parse_seconds(value: Optional[str]) -> Optional[int]:
+    """Parse a non-negative integer number of seconds from a header value"""
+    if value and value.strip().isdigit():
+        return int(value.strip())
+    return None
+
+
+def _parse_max_age(cache_control: Optional[str]) -> Optional[int]:
+    """Extract max-age from a Cache-Control header"""
+    for directive in (cache_control or "").split(","):
+        key, _, value = directive.strip().partition("=")
+        if key.lower() == "max-age":
+            return _parse_seconds(value)
+    return None
 
 
 def get_latest_version() -> Optional[str]:
-    """Get latest version from PyPI"""
+    """Get latest version from PyPI
+    
+    Results are cached on disk for the response's Cache-Control max-age
+    (24 hours if absent). When PyPI rate-limits us, no request is made
+    again until its Retry-After delay has passed. When PyPI is unreachable,
+    a stale cached value is returned if one exists.
+    """
+    cached = _read_cache()
+    if cached and time.time() - cached["ts"] < cached.get("ttl", _TTL):
+        return cached["value"]
+    stale_value = cached["value"] if cached else None
+    
+    request = urllib.request.Request(PYPI_URL, headers=_REQUEST_HEADERS)
     try:
-        with urllib.request.urlopen(
-            "https://pypi.org/pypi/ningfastforge/json", 
-            timeout=3
-        ) as response:
-            data = json.loads(response.read().decode())
-            return data["info"]["version"]
+        with urllib.request.urlopen(request, timeout=_REQUEST_TIMEOUT) as response:
+            latest = json.load(response)["info"]["version"]
+            ttl = _parse_max_age(response.headers.get("Cache-Control"))
+    except urllib.error.HTTPError as e:
+        if e.code in _RATE_LIMIT_STATUSES:
+            retry_after = _parse_seconds(e.headers.get("Retry-After"))
+            if retry_after is not None:
+                # Back off: keep serving the stale value until PyPI says to retry
+                _write_cache(stale_value, ttl=retry_after)
+        return stale_value
     except (urllib.error.URLError, json.JSONDecodeError, KeyError, TimeoutError):
-        return None
+        return stale_value
+    
+    _write_cache(latest, ttl=_TTL if ttl is None else ttl)
+    return latest
+
+
+def _prefetch_worker() -> None:
+    """Fetch the latest version and publish it to waiting callers"""
+    try:
+        _prefetch_result["value"] = get_latest_version()
+    finally:
+        _prefetch_done.set()
+
+
+def _join_prefetch() -> None:
+    """Give a still-running prefetch time to finish and fill the cache"""
+    if _prefetch_thread is not None:
+        _prefetch_thread.join(_REQUEST_TIMEOUT)
+
+
+def prefetch_latest_version() -> None:
+    """Start fetching the latest version in a background thread
+    
+    Safe to call multiple times; only the first call starts a request.
+    At exit, a still-running request is waited on for up to the request
+    timeout so a slow PyPI response still gets cached for the next run.
+    """
+    global _prefetch_thread
+    if _prefetch_thread is not None:
+        return
+    _prefetch_thread = threading.Thread(target=_prefetch_worker, daemon=True)
+    _prefetch_thread.start()
+    atexit.register(_join_prefetch)
+
+
+def get_prefetched_version(timeout: float = _PREFETCH_DEADLINE) -> Tuple[bool, Optional[str]]:
+    """Wait briefly for the prefetched latest version
+    
+    Falls back to a blocking lookup if no prefetch was started.
+    
+    Returns:
+        Tuple of (finished, latest_version)
+    """
+    if _prefetch_thread is None:
+        return True, get_latest_version()
+    if not _prefetch_done.wait(timeout):
+        return False, None
+    return True, _prefetch_result.get("value")
 
 
 def compare_versions(current: str, latest: str) -> Tuple[bool, str]:
@@ -94,7 +231,10 @@ def check_for_updates(silent: bool = False, interactive: bool = True) -> bool:
     Returns:
         True if update is available, False otherwise
     """
-    latest = get_latest_version()
+    finished, latest = get_prefetched_version()
+    if not finished:
+        # Still waiting on PyPI; don't hold up the CLI for it
+        return False
     if not latest:
         if not silent:
             console.print("[dim yellow]⚠️  Unable to check for updates[/dim yellow]")
@@ -113,6 +253,8 @@ def check_for_updates(silent: bool = False, interactive: bool = True) -> bool:
 
 def show_interactive_update_prompt(latest_version: str) -> None:
     """Show interactive update prompt with auto-update option"""
+    import questionary
+    
     colors = get_colors()
     
     console.print()
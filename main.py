@@ -5,7 +5,7 @@ from typing import Optional
 from ui.logo import show_logo
 from commands.init import init_command
 from core.version import __version__
-from core.utils.version_checker import check_for_updates
+from core.utils.version_checker import check_for_updates, prefetch_latest_version
 
 # Create main application
 app = typer.Typer(
@@ -43,6 +43,9 @@ def main_callback(
 
     A powerful FastAPI project scaffolding generator
     """
+    # Start the update check early so it overlaps with startup work
+    prefetch_latest_version()
+    
     if ctx.invoked_subcommand is None:
         show_logo()
         typer.echo()  # Empty line
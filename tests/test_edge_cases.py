@@ -7,7 +7,6 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from commands.init import (
-    extract_choice,
     handle_existing_project,
     build_project_config,
     save_config_file,
@@ -20,16 +19,6 @@ from core.utils import ProjectConfig
 class TestEdgeCases:
     """Edge case tests"""
     
-    def test_extract_choice_multiple_parentheses(self):
-        """Should handle multiple parentheses correctly"""
-        result = extract_choice("Option (with) (multiple) (parens)")
-        assert result == "Option"
-    
-    def test_extract_choice_nested_parentheses(self):
-        """Should handle nested parentheses"""
-        result = extract_choice("Option (with (nested) parens)")
-        assert result == "Option"
-    
     def test_project_name_with_special_chars(self):
         """Should handle project names with special characters"""
         config = build_project_config(
@@ -176,6 +165,26 @@ class TestConfigReaderEdgeCases:
         reader = ConfigReader(temp_dir)
         reader.load_config()
         assert reader.has_celery() is True
+    
+    def test_set_config_without_file(self, temp_dir):
+        """Should accept an in-memory config without reading config.json"""
+        config = {
+            "project_name": "test",
+            "database": {"type": "SQLite", "orm": "SQLAlchemy"},
+            "features": {"auth": {"type": "complete", "refresh_token": True}, "docker": True}
+        }
+        
+        reader = ConfigReader(temp_dir).set_config(config)
+        assert reader.validate_config() is True
+        assert reader.get_database_type() == "SQLite"
+        assert reader.get_auth_type() == "complete"
+        assert reader.has_refresh_token() is True
+        assert reader.has_docker() is True
+
+    def test_project_identifier(self, temp_dir):
+        """Should normalize the project name into an identifier"""
+        reader = ConfigReader(temp_dir).set_config({"project_name": "My-Project v2"})
+        assert reader.get_project_identifier() == "my_project_v2"
 
 
 class TestProjectConfigUtils:
@@ -253,8 +262,8 @@ class TestHandleExistingProject:
         from click.exceptions import Exit
         mock_style = MagicMock()
         
-        with patch('commands.init.questionary') as mock_q:
-            mock_q.select.return_value.ask.return_value = "Cancel - Keep existing project"
+        with patch('questionary.select') as mock_select:
+            mock_select.return_value.ask.return_value = "Cancel - Keep existing project"
             
             with pytest.raises(Exit):
                 handle_existing_project("existing", mock_style, use_current_dir=False)
@@ -269,8 +278,8 @@ class TestHandleExistingProject:
         (sub_project / ".forge").mkdir()
         (sub_project / "app").mkdir()
         
-        with patch('commands.init.questionary') as mock_q:
-            mock_q.select.return_value.ask.return_value = "Overwrite - Regenerate entire project"
+        with patch('questionary.select') as mock_select:
+            mock_select.return_value.ask.return_value = "Overwrite - Regenerate entire project"
             with patch('commands.init.Path') as mock_path:
                 mock_path.cwd.return_value = temp_project
                 
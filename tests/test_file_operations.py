@@ -0,0 +1,55 @@
+"""Tests for core/utils/file_operations.py"""
+import os
+import pytest
+
+from core.utils import FileOperations
+
+
+class TestCreateFile:
+    """Tests for FileOperations.create_file"""
+
+    def test_creates_parent_directories(self, tmp_path):
+        """Should create missing parent directories"""
+        path = FileOperations(tmp_path).create_file("a/b/c.txt", "hello")
+        assert path.read_text() == "hello"
+
+    def test_existing_file_without_overwrite(self, tmp_path):
+        """Should refuse to replace an existing file"""
+        file_ops = FileOperations(tmp_path)
+        file_ops.create_file("a.txt", "one")
+        with pytest.raises(FileExistsError):
+            file_ops.create_file("a.txt", "two")
+
+    def test_identical_content_is_not_rewritten(self, tmp_path):
+        """Should leave the file untouched when content is unchanged"""
+        file_ops = FileOperations(tmp_path)
+        path = file_ops.create_file("a.txt", "same")
+        os.utime(path, ns=(0, 0))
+
+        file_ops.create_file("a.txt", "same", overwrite=True)
+        assert path.stat().st_mtime_ns == 0
+
+        file_ops.create_file("a.txt", "changed", overwrite=True)
+        assert path.read_text() == "changed"
+
+    def test_create_file_bytes_writes_data_verbatim(self, tmp_path):
+        """Should write pre-encoded content without re-encoding it"""
+        path = FileOperations(tmp_path).create_file_bytes("a.txt", "héllo\n".encode("utf-8"))
+        assert path.read_bytes() == b"h\xc3\xa9llo\n"
+
+
+class TestCreateFilesBatch:
+    """Tests for FileOperations.create_files_batch"""
+
+    def test_creates_all_files(self, tmp_path):
+        """Should create every file along with its parent directories"""
+        paths = FileOperations(tmp_path).create_files_batch([("a/__init__.py", ""), ("a/b/c.py", "x = 1\n")])
+        assert [p.read_text() for p in paths] == ["", "x = 1\n"]
+
+    def test_existing_file_without_overwrite(self, tmp_path):
+        """Should refuse to replace an existing file"""
+        file_ops = FileOperations(tmp_path)
+        file_ops.create_file("a.txt", "one")
+        with pytest.raises(FileExistsError):
+            file_ops.create_files_batch([("a.txt", "two")])
+        assert (tmp_path / "a.txt").read_text() == "one"
@@ -7,7 +7,6 @@ from pathlib import Path
 from unittest.mock import patch, MagicMock
 
 from commands.init import (
-    extract_choice,
     get_auth_config,
     collect_project_name,
     build_project_config,
@@ -16,29 +15,6 @@ from commands.init import (
 )
 
 
-class TestExtractChoice:
-    """Tests for extract_choice function"""
-    
-    def test_extract_choice_with_description(self):
-        """Should extract value before parentheses"""
-        assert extract_choice("PostgreSQL (Recommended)") == "PostgreSQL"
-        assert extract_choice("SQLite (Development/Small Projects)") == "SQLite"
-    
-    def test_extract_choice_without_description(self):
-        """Should return original value if no parentheses"""
-        assert extract_choice("MySQL") == "MySQL"
-        assert extract_choice("SQLAlchemy") == "SQLAlchemy"
-    
-    def test_extract_choice_empty_string(self):
-        """Should return default for empty string"""
-        assert extract_choice("", "default") == "default"
-        assert extract_choice("") == ""
-    
-    def test_extract_choice_none(self):
-        """Should return default for None"""
-        assert extract_choice(None, "default") == "default"
-
-
 class TestGetAuthConfig:
     """Tests for get_auth_config function"""
     
@@ -86,8 +62,8 @@ class TestCollectProjectName:
     def test_with_none_prompts_user(self):
         """Should prompt user when name is None"""
         mock_style = MagicMock()
-        with patch('commands.init.questionary') as mock_questionary:
-            mock_questionary.text.return_value.ask.return_value = "user-input-project"
+        with patch('questionary.text') as mock_text:
+            mock_text.return_value.ask.return_value = "user-input-project"
             name, use_current_dir = collect_project_name(None, mock_style)
             assert name == "user-input-project"
             assert use_current_dir is False
@@ -95,8 +71,8 @@ class TestCollectProjectName:
     def test_with_none_and_dot_input(self):
         """Should handle '.' input from prompt"""
         mock_style = MagicMock()
-        with patch('commands.init.questionary') as mock_questionary:
-            mock_questionary.text.return_value.ask.return_value = "."
+        with patch('questionary.text') as mock_text:
+            mock_text.return_value.ask.return_value = "."
             with patch('commands.init.Path') as mock_path:
                 mock_path.cwd.return_value.name = "current-dir"
                 name, use_current_dir = collect_project_name(None, mock_style)
@@ -106,8 +82,8 @@ class TestCollectProjectName:
     def test_with_none_and_empty_input(self):
         """Should use default when user provides empty input"""
         mock_style = MagicMock()
-        with patch('commands.init.questionary') as mock_questionary:
-            mock_questionary.text.return_value.ask.return_value = None
+        with patch('questionary.text') as mock_text:
+            mock_text.return_value.ask.return_value = None
             name, use_current_dir = collect_project_name(None, mock_style)
             assert name == "forge-project"
             assert use_current_dir is False
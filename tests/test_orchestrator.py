@@ -0,0 +1,60 @@
+"""Tests for core/generators/orchestrator.py"""
+import itertools
+from importlib import import_module
+
+import pytest
+
+from core.config_reader import ConfigReader
+from core.decorators import GENERATORS
+from core.generators.orchestrator import _CORE_MODULES, _GATED_MODULES
+
+
+def _all_configs():
+    """Yield a config reader for every feature combination"""
+    flags = ["docker", "redis", "celery", "testing", "cors"]
+    for database, migration_tool, auth_type, enabled in itertools.product(
+        ["PostgreSQL", "MySQL", "SQLite"],
+        [None, "Alembic"],
+        ["basic", "complete"],
+        itertools.product([False, True], repeat=len(flags)),
+    ):
+        features = dict(zip(flags, enabled))
+        features["auth"] = {"type": auth_type}
+        yield ConfigReader(".").set_config({
+            "project_name": "test",
+            "database": {"type": database, "orm": "SQLModel", "migration_tool": migration_tool},
+            "features": features,
+        })
+
+
+@pytest.fixture(scope="module", autouse=True)
+def import_all_generators():
+    """Import every generator module regardless of gates"""
+    for module_name in _CORE_MODULES:
+        import_module(module_name)
+    for _gate, module_names in _GATED_MODULES:
+        for module_name in module_names:
+            import_module(module_name)
+
+
+class TestGatedModules:
+    """Tests for the feature-gated generator imports"""
+
+    @pytest.mark.parametrize(
+        "gate,module_name",
+        [(gate, name) for gate, names in _GATED_MODULES for name in names],
+        ids=[name for _gate, names in _GATED_MODULES for name in names],
+    )
+    def test_gate_covers_enabled_generators(self, gate, module_name):
+        """Should never skip importing a module whose generator is enabled"""
+        gen_defs = [
+            gen_def for gen_def in GENERATORS.values()
+            if gen_def.generator_class.__module__ == module_name
+        ]
+        assert gen_defs, f"{module_name} registers no generators"
+
+        for gen_def in gen_defs:
+            assert gen_def.enabled_when is not None, f"{gen_def.name} is always enabled"
+            for config in _all_configs():
+                if gen_def.enabled_when(config):
+                    assert gate(config), f"{gen_def.name} is enabled but {module_name} is not imported"
@@ -0,0 +1,172 @@
+"""Tests for core/utils/version_checker.py"""
+import io
+import json
+import threading
+import time
+import urllib.error
+import pytest
+from email.message import Message
+from unittest.mock import patch
+
+from core.utils import version_checker
+from core.utils.version_checker import get_latest_version
+
+
+class TestLatestVersionCache:
+    """Tests for the on-disk PyPI version cache"""
+
+    @pytest.fixture(autouse=True)
+    def cache_path(self, tmp_path, monkeypatch):
+        path = tmp_path / "forge_pypi_version.json"
+        monkeypatch.setattr(version_checker, "_CACHE_PATH", path)
+        return path
+
+    def test_fresh_cache_skips_network(self, cache_path):
+        """Should return cached value without any network call"""
+        cache_path.write_text(json.dumps({"ts": time.time(), "value": "9.9.9"}))
+
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            assert get_latest_version() == "9.9.9"
+            mock_urlopen.assert_not_called()
+
+    def test_fetch_writes_cache(self, cache_path):
+        """Should cache the fetched version on disk"""
+        payload = io.BytesIO(json.dumps({"info": {"version": "1.2.3"}}).encode())
+
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            response = mock_urlopen.return_value.__enter__.return_value
+            response.read = payload.read
+            response.headers = {"Cache-Control": "max-age=900, public"}
+            assert get_latest_version() == "1.2.3"
+
+        entry = json.loads(cache_path.read_text())
+        assert entry["value"] == "1.2.3"
+        assert entry["ttl"] == 900
+        request = mock_urlopen.call_args[0][0]
+        assert request.get_header("User-agent") == version_checker.USER_AGENT
+
+    def test_stale_cache_used_when_offline(self, cache_path):
+        """Should fall back to a stale cached value when PyPI is unreachable"""
+        cache_path.write_text(json.dumps({"ts": 0, "value": "0.0.1"}))
+
+        with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("offline")):
+            assert get_latest_version() == "0.0.1"
+
+    def test_no_cache_and_offline(self):
+        """Should return None when offline with no cache"""
+        with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("offline")):
+            assert get_latest_version() is None
+
+    def test_rate_limit_honors_retry_after(self, cache_path):
+        """Should back off for Retry-After seconds when rate limited"""
+        cache_path.write_text(json.dumps({"ts": 0, "value": "0.0.1"}))
+        headers = Message()
+        headers["Retry-After"] = "120"
+        error = urllib.error.HTTPError(version_checker.PYPI_URL, 429, "Too Many Requests", headers, None)
+
+        with patch("urllib.request.urlopen", side_effect=error):
+            assert get_latest_version() == "0.0.1"
+
+        with patch("urllib.request.urlopen") as mock_urlopen:
+            assert get_latest_version() == "0.0.1"
+            mock_urlopen.assert_not_called()
+        assert json.loads(cache_path.read_text())["ttl"] == 120
+
+    def test_corrupt_cache_is_ignored(self, cache_path):
+        """Should refetch instead of crashing on a cache with bad field types"""
+        cache_path.write_text(json.dumps({"ts": "x", "value": "0.0.1", "ttl": "soon"}))
+
+        with patch("urllib.request.urlopen", side_effect=urllib.error.URLError("offline")):
+            assert get_latest_version() is None
+
+    def test_write_leaves_no_temp_files(self, cache_path):
+        """Should write the cache atomically without leftover temp files"""
+        version_checker._write_cache("1.0.0")
+
+        assert json.loads(cache_path.read_text())["value"] == "1.0.0"
+        assert list(cache_path.parent.iterdir()) == [cache_path]
+
+
+class TestPrefetchLatestVersion:
+    """Tests for the background PyPI version prefetch"""
+
+    @pytest.fixture(autouse=True)
+    def reset_prefetch_state(self, monkeypatch):
+        monkeypatch.setattr(version_checker, "_prefetch_thread", None)
+        monkeypatch.setattr(version_checker, "_prefetch_done", threading.Event())
+        monkeypatch.setattr(version_checker, "_prefetch_result", {})
+        monkeypatch.setattr(version_checker.atexit, "register", lambda func: func)
+
+    @pytest.fixture
+    def release(self):
+        event = threading.Event()
+        yield event
+        event.set()
+
+    def test_deadline_expires(self, release):
+        """Should give up waiting when the prefetch is still running"""
+        def blocked():
+            release.wait()
+            return "9.9.9"
+
+        with patch.object(version_checker, "get_latest_version", side_effect=blocked):
+            version_checker.prefetch_latest_version()
+            assert version_checker.get_prefetched_version(timeout=0.01) == (False, None)
+
+            with patch.object(version_checker.console, "print") as mock_print:
+                assert version_checker.check_for_updates() is False
+                mock_print.assert_not_called()
+
+    def test_finished_prefetch(self, release):
+        """Should return the value once the prefetch has finished"""
+        def blocked():
+            release.wait()
+            return "9.9.9"
+
+        with patch.object(version_checker, "get_latest_version", side_effect=blocked):
+            version_checker.prefetch_latest_version()
+            release.set()
+            assert version_checker.get_prefetched_version(timeout=5) == (True, "9.9.9")
+
+    def test_blocking_fallback_without_prefetch(self):
+        """Should look up the version directly when no prefetch was started"""
+        with patch.object(version_checker, "get_latest_version", return_value="1.2.3") as mock_get:
+            assert version_checker.get_prefetched_version() == (True, "1.2.3")
+            mock_get.assert_called_once()
+
+    def test_second_prefetch_is_noop(self, release):
+        """Should start only one background request"""
+        calls = []
+
+        def blocked():
+            calls.append(1)
+            release.wait()
+            return "9.9.9"
+
+        with patch.object(version_checker, "get_latest_version", side_effect=blocked):
+            version_checker.prefetch_latest_version()
+            thread = version_checker._prefetch_thread
+            version_checker.prefetch_latest_version()
+            assert version_checker._prefetch_thread is thread
+            release.set()
+            thread.join(timeout=5)
+        assert len(calls) == 1
+
+    def test_exit_waits_for_running_prefetch(self, release):
+        """Should let a slow prefetch finish at exit so its result is cached"""
+        finished = threading.Event()
+
+        def slow():
+            release.wait()
+            finished.set()
+            return "9.9.9"
+
+        with patch.object(version_checker, "get_latest_version", side_effect=slow), \
+                patch.object(version_checker.atexit, "register") as mock_register:
+            version_checker.prefetch_latest_version()
+            mock_register.assert_called_once_with(version_checker._join_prefetch)
+            assert version_checker.get_prefetched_version(timeout=0.01) == (False, None)
+
+            threading.Timer(0.05, release.set).start()
+            version_checker._join_prefetch()
+        assert finished.is_set()
@@ -2,19 +2,23 @@
 from rich.panel import Panel
 from rich.text import Text
 from rich.align import Align
-from typing import Optional, Literal, Union
+from typing import TYPE_CHECKING, Optional, Literal, Union
 from rich import box
-import questionary
 from ui.colors import get_colors, get_gradients, console
 
+if TYPE_CHECKING:
+    import questionary
 
-def create_questionary_style() -> questionary.Style:
+
+def create_questionary_style() -> "questionary.Style":
     """
     Create unified questionary style
     
     Returns:
         questionary.Style object
     """
+    import questionary
+    
     colors = get_colors()
     return questionary.Style([
         ('qmark', f'fg:{colors.primary} bold'),